@@ -1,400 +0,0 @@
-runtimes = [(0.25, 10, 10, 18, 2.6941299438476562e-05),
- (0.25, 10, 10, 11, 1.6927719116210938e-05),
- (0.25, 10, 10, 11, 1.3113021850585938e-05),
- (0.25, 10, 10, 12, 0.00018525123596191406),
- (0.25, 10, 10, 13, 1.2159347534179688e-05),
- (0.25, 10, 10, 13, 1.2159347534179688e-05),
- (0.25, 10, 10, 13, 1.1920928955078125e-05),
- (0.25, 10, 10, 10, 1.1205673217773438e-05),
- (0.25, 10, 10, 14, 1.0728836059570312e-05),
- (0.25, 10, 10, 13, 1.0967254638671875e-05),
- (0.25, 50, 50, 64, 5.91278076171875e-05),
- (0.25, 50, 50, 60, 4.982948303222656e-05),
- (0.25, 50, 50, 56, 5.2928924560546875e-05),
- (0.25, 50, 50, 62, 5.1021575927734375e-05),
- (0.25, 50, 50, 60, 4.887580871582031e-05),
- (0.25, 50, 50, 64, 5.507469177246094e-05),
- (0.25, 50, 50, 63, 4.887580871582031e-05),
- (0.25, 50, 50, 60, 4.696846008300781e-05),
- (0.25, 50, 50, 61, 4.887580871582031e-05),
- (0.25, 50, 50, 66, 4.887580871582031e-05),
- (0.25, 100, 100, 127, 0.00025177001953125),
- (0.25, 100, 100, 122, 9.894371032714844e-05),
- (0.25, 100, 100, 117, 9.298324584960938e-05),
- (0.25, 100, 100, 124, 9.131431579589844e-05),
- (0.25, 100, 100, 122, 0.0001380443572998047),
- (0.25, 100, 100, 129, 0.00010800361633300781),
- (0.25, 100, 100, 124, 0.00010204315185546875),
- (0.25, 100, 100, 122, 0.00010704994201660156),
- (0.25, 100, 100, 122, 0.0001087188720703125),
- (0.25, 100, 100, 126, 0.00028395652770996094),
- (0.25, 500, 500, 620, 0.0006039142608642578),
- (0.25, 500, 500, 627, 0.0014400482177734375),
- (0.25, 500, 500, 608, 0.0005650520324707031),
- (0.25, 500, 500, 608, 0.0005660057067871094),
- (0.25, 500, 500, 619, 0.0006411075592041016),
- (0.25, 500, 500, 624, 0.0005860328674316406),
- (0.25, 500, 500, 616, 0.0005719661712646484),
- (0.25, 500, 500, 615, 0.0005691051483154297),
- (0.25, 500, 500, 614, 0.0006079673767089844),
- (0.25, 500, 500, 610, 0.0005788803100585938),
- (0.25, 1000, 1000, 1250, 0.0011091232299804688),
- (0.25, 1000, 1000, 1252, 0.001997232437133789),
- (0.25, 1000, 1000, 1240, 0.0010972023010253906),
- (0.25, 1000, 1000, 1239, 0.0010848045349121094),
- (0.25, 1000, 1000, 1276, 0.0012180805206298828),
- (0.25, 1000, 1000, 1233, 0.0011129379272460938),
- (0.25, 1000, 1000, 1229, 0.0011019706726074219),
- (0.25, 1000, 1000, 1240, 0.002264738082885742),
- (0.25, 1000, 1000, 1238, 0.0010929107666015625),
- (0.25, 1000, 1000, 1226, 0.001107931137084961),
- (0.25, 2000, 2000, 2514, 0.0024721622467041016),
- (0.25, 2000, 2000, 2486, 0.0030851364135742188),
- (0.25, 2000, 2000, 2483, 0.0021839141845703125),
- (0.25, 2000, 2000, 2507, 0.0032968521118164062),
- (0.25, 2000, 2000, 2536, 0.0021719932556152344),
- (0.25, 2000, 2000, 2494, 0.002254962921142578),
- (0.25, 2000, 2000, 2506, 0.0021469593048095703),
- (0.25, 2000, 2000, 2502, 0.002168893814086914),
- (0.25, 2000, 2000, 2479, 0.003117084503173828),
- (0.25, 2000, 2000, 2458, 0.002134084701538086),
- (0.25, 4000, 4000, 5001, 0.0054340362548828125),
- (0.25, 4000, 4000, 4983, 0.005205869674682617),
- (0.25, 4000, 4000, 4973, 0.004869222640991211),
- (0.25, 4000, 4000, 5013, 0.008383035659790039),
- (0.25, 4000, 4000, 5026, 0.004849910736083984),
- (0.25, 4000, 4000, 4970, 0.004918098449707031),
- (0.25, 4000, 4000, 4994, 0.0049228668212890625),
- (0.25, 4000, 4000, 4953, 0.004897117614746094),
- (0.25, 4000, 4000, 4978, 0.004857063293457031),
- (0.25, 4000, 4000, 4935, 0.004904985427856445),
- (0.25, 8000, 8000, 9970, 0.010896921157836914),
- (0.25, 8000, 8000, 9977, 0.009889841079711914),
- (0.25, 8000, 8000, 10016, 0.009638071060180664),
- (0.25, 8000, 8000, 10021, 0.009602785110473633),
- (0.25, 8000, 8000, 9991, 0.010229825973510742),
- (0.25, 8000, 8000, 9948, 0.010116815567016602),
- (0.25, 8000, 8000, 9953, 0.010040044784545898),
- (0.25, 8000, 8000, 9881, 0.013447999954223633),
- (0.25, 8000, 8000, 9990, 0.009827136993408203),
- (0.25, 8000, 8000, 9923, 0.00977778434753418),
- (0.5, 10, 10, 19, 1.71661376953125e-05),
- (0.5, 10, 10, 19, 1.1920928955078125e-05),
- (0.5, 10, 10, 15, 1.2159347534179688e-05),
- (0.5, 10, 10, 18, 1.0967254638671875e-05),
- (0.5, 10, 10, 25, 1.0967254638671875e-05),
- (0.5, 10, 10, 18, 1.1205673217773438e-05),
- (0.5, 10, 10, 17, 1.0967254638671875e-05),
- (0.5, 10, 10, 13, 9.775161743164062e-06),
- (0.5, 10, 10, 16, 9.775161743164062e-06),
- (0.5, 10, 10, 17, 1.0013580322265625e-05),
- (0.5, 50, 50, 83, 5.340576171875e-05),
- (0.5, 50, 50, 86, 5.078315734863281e-05),
- (0.5, 50, 50, 81, 4.887580871582031e-05),
- (0.5, 50, 50, 83, 4.792213439941406e-05),
- (0.5, 50, 50, 89, 4.887580871582031e-05),
- (0.5, 50, 50, 86, 4.792213439941406e-05),
- (0.5, 50, 50, 86, 4.7206878662109375e-05),
- (0.5, 50, 50, 81, 5.698204040527344e-05),
- (0.5, 50, 50, 84, 4.696846008300781e-05),
- (0.5, 50, 50, 93, 4.792213439941406e-05),
- (0.5, 100, 100, 162, 0.00026607513427734375),
- (0.5, 100, 100, 176, 9.822845458984375e-05),
- (0.5, 100, 100, 166, 9.512901306152344e-05),
- (0.5, 100, 100, 167, 9.131431579589844e-05),
- (0.5, 100, 100, 170, 9.226799011230469e-05),
- (0.5, 100, 100, 186, 9.584426879882812e-05),
- (0.5, 100, 100, 180, 9.608268737792969e-05),
- (0.5, 100, 100, 164, 9.584426879882812e-05),
- (0.5, 100, 100, 179, 9.703636169433594e-05),
- (0.5, 100, 100, 181, 0.00028586387634277344),
- (0.5, 500, 500, 847, 0.0006351470947265625),
- (0.5, 500, 500, 907, 0.0005891323089599609),
- (0.5, 500, 500, 850, 0.000598907470703125),
- (0.5, 500, 500, 870, 0.0006461143493652344),
- (0.5, 500, 500, 869, 0.0009577274322509766),
- (0.5, 500, 500, 873, 0.0005850791931152344),
- (0.5, 500, 500, 881, 0.0005769729614257812),
- (0.5, 500, 500, 873, 0.0006139278411865234),
- (0.5, 500, 500, 883, 0.0005939006805419922),
- (0.5, 500, 500, 869, 0.0005800724029541016),
- (0.5, 1000, 1000, 1759, 0.0011279582977294922),
- (0.5, 1000, 1000, 1786, 0.0013499259948730469),
- (0.5, 1000, 1000, 1744, 0.0012259483337402344),
- (0.5, 1000, 1000, 1776, 0.002215147018432617),
- (0.5, 1000, 1000, 1786, 0.0011670589447021484),
- (0.5, 1000, 1000, 1765, 0.0012209415435791016),
- (0.5, 1000, 1000, 1754, 0.0011441707611083984),
- (0.5, 1000, 1000, 1787, 0.0011670589447021484),
- (0.5, 1000, 1000, 1791, 0.0011429786682128906),
- (0.5, 1000, 1000, 1756, 0.002254009246826172),
- (0.5, 2000, 2000, 3568, 0.002414703369140625),
- (0.5, 2000, 2000, 3587, 0.0021927356719970703),
- (0.5, 2000, 2000, 3521, 0.0035886764526367188),
- (0.5, 2000, 2000, 3549, 0.002203226089477539),
- (0.5, 2000, 2000, 3611, 0.002238035202026367),
- (0.5, 2000, 2000, 3542, 0.0034601688385009766),
- (0.5, 2000, 2000, 3547, 0.002226114273071289),
- (0.5, 2000, 2000, 3529, 0.002180814743041992),
- (0.5, 2000, 2000, 3521, 0.01106715202331543),
- (0.5, 2000, 2000, 3539, 0.0021660327911376953),
- (0.5, 4000, 4000, 7176, 0.005546092987060547),
- (0.5, 4000, 4000, 7191, 0.0052721500396728516),
- (0.5, 4000, 4000, 7129, 0.00443577766418457),
- (0.5, 4000, 4000, 7198, 0.004351139068603516),
- (0.5, 4000, 4000, 7256, 0.00524592399597168),
- (0.5, 4000, 4000, 7120, 0.004976034164428711),
- (0.5, 4000, 4000, 7156, 0.005125761032104492),
- (0.5, 4000, 4000, 7043, 0.005012989044189453),
- (0.5, 4000, 4000, 7074, 0.004347085952758789),
- (0.5, 4000, 4000, 7129, 0.004302978515625),
- (0.5, 8000, 8000, 14419, 0.010132074356079102),
- (0.5, 8000, 8000, 14419, 0.015740156173706055),
- (0.5, 8000, 8000, 14415, 0.009868144989013672),
- (0.5, 8000, 8000, 14438, 0.010349035263061523),
- (0.5, 8000, 8000, 14333, 0.00983119010925293),
- (0.5, 8000, 8000, 14382, 0.010707855224609375),
- (0.5, 8000, 8000, 14310, 0.00970315933227539),
- (0.5, 8000, 8000, 14225, 0.01727294921875),
- (0.5, 8000, 8000, 14294, 0.009835004806518555),
- (0.5, 8000, 8000, 14384, 0.01018381118774414),
- (1, 10, 10, 31, 1.6927719116210938e-05),
- (1, 10, 10, 24, 1.1920928955078125e-05),
- (1, 10, 10, 17, 1.2159347534179688e-05),
- (1, 10, 10, 28, 1.0967254638671875e-05),
- (1, 10, 10, 30, 1.0967254638671875e-05),
- (1, 10, 10, 23, 1.0013580322265625e-05),
- (1, 10, 10, 27, 1.0967254638671875e-05),
- (1, 10, 10, 20, 1.0967254638671875e-05),
- (1, 10, 10, 22, 1.0013580322265625e-05),
- (1, 10, 10, 23, 1.0967254638671875e-05),
- (1, 50, 50, 137, 6.103515625e-05),
- (1, 50, 50, 142, 5.412101745605469e-05),
- (1, 50, 50, 127, 5.1021575927734375e-05),
- (1, 50, 50, 130, 5.1975250244140625e-05),
- (1, 50, 50, 144, 5.2928924560546875e-05),
- (1, 50, 50, 127, 5.0067901611328125e-05),
- (1, 50, 50, 133, 5.221366882324219e-05),
- (1, 50, 50, 121, 5.078315734863281e-05),
- (1, 50, 50, 135, 5.1021575927734375e-05),
- (1, 50, 50, 145, 5.125999450683594e-05),
- (1, 100, 100, 254, 0.0003020763397216797),
- (1, 100, 100, 274, 9.918212890625e-05),
- (1, 100, 100, 274, 9.608268737792969e-05),
- (1, 100, 100, 269, 9.775161743164062e-05),
- (1, 100, 100, 275, 9.703636169433594e-05),
- (1, 100, 100, 273, 0.00011491775512695312),
- (1, 100, 100, 291, 0.00011205673217773438),
- (1, 100, 100, 257, 0.00010275840759277344),
- (1, 100, 100, 279, 0.00010085105895996094),
- (1, 100, 100, 279, 0.00032782554626464844),
- (1, 500, 500, 1463, 0.0005729198455810547),
- (1, 500, 500, 1464, 0.0007669925689697266),
- (1, 500, 500, 1436, 0.0005660057067871094),
- (1, 500, 500, 1426, 0.0008089542388916016),
- (1, 500, 500, 1418, 0.0005669593811035156),
- (1, 500, 500, 1411, 0.0008380413055419922),
- (1, 500, 500, 1422, 0.0005853176116943359),
- (1, 500, 500, 1399, 0.0007231235504150391),
- (1, 500, 500, 1420, 0.0005297660827636719),
- (1, 500, 500, 1436, 0.0006968975067138672),
- (1, 1000, 1000, 2958, 0.001210927963256836),
- (1, 1000, 1000, 2899, 0.0013201236724853516),
- (1, 1000, 1000, 2862, 0.0013163089752197266),
- (1, 1000, 1000, 2964, 0.0012669563293457031),
- (1, 1000, 1000, 2894, 0.0021789073944091797),
- (1, 1000, 1000, 2980, 0.0012521743774414062),
- (1, 1000, 1000, 2962, 0.0012979507446289062),
- (1, 1000, 1000, 2885, 0.0012149810791015625),
- (1, 1000, 1000, 2900, 0.0012202262878417969),
- (1, 1000, 1000, 2911, 0.0012671947479248047),
- (1, 2000, 2000, 5889, 0.0024950504302978516),
- (1, 2000, 2000, 5896, 0.002471923828125),
- (1, 2000, 2000, 5826, 0.0025169849395751953),
- (1, 2000, 2000, 6066, 0.0024890899658203125),
- (1, 2000, 2000, 6038, 0.0027201175689697266),
- (1, 2000, 2000, 6013, 0.002424955368041992),
- (1, 2000, 2000, 6013, 0.002393007278442383),
- (1, 2000, 2000, 5808, 0.0024118423461914062),
- (1, 2000, 2000, 5766, 0.002386808395385742),
- (1, 2000, 2000, 5966, 0.0023589134216308594),
- (1, 4000, 4000, 12071, 0.00670623779296875),
- (1, 4000, 4000, 11922, 0.00474095344543457),
- (1, 4000, 4000, 12031, 0.005669832229614258),
- (1, 4000, 4000, 12144, 0.005649089813232422),
- (1, 4000, 4000, 12106, 0.005653858184814453),
- (1, 4000, 4000, 12145, 0.004594087600708008),
- (1, 4000, 4000, 12129, 0.00572967529296875),
- (1, 4000, 4000, 11755, 0.005574941635131836),
- (1, 4000, 4000, 11790, 0.0058650970458984375),
- (1, 4000, 4000, 12013, 0.00533294677734375),
- (1, 8000, 8000, 24407, 0.011121273040771484),
- (1, 8000, 8000, 24219, 0.011673927307128906),
- (1, 8000, 8000, 24424, 0.0160980224609375),
- (1, 8000, 8000, 24525, 0.01188516616821289),
- (1, 8000, 8000, 24114, 0.010853767395019531),
- (1, 8000, 8000, 24625, 0.012190103530883789),
- (1, 8000, 8000, 24359, 0.01043701171875),
- (1, 8000, 8000, 24105, 0.010767698287963867),
- (1, 8000, 8000, 24276, 0.010825157165527344),
- (1, 8000, 8000, 24217, 0.018095970153808594),
- (2, 10, 10, 37, 1.8835067749023438e-05),
- (2, 10, 10, 34, 1.2874603271484375e-05),
- (2, 10, 10, 37, 1.0967254638671875e-05),
- (2, 10, 10, 34, 1.0967254638671875e-05),
- (2, 10, 10, 38, 1.0967254638671875e-05),
- (2, 10, 10, 48, 1.1920928955078125e-05),
- (2, 10, 10, 33, 1.0967254638671875e-05),
- (2, 10, 10, 30, 1.1205673217773438e-05),
- (2, 10, 10, 34, 1.0967254638671875e-05),
- (2, 10, 10, 36, 1.0967254638671875e-05),
- (2, 50, 50, 235, 6.198883056640625e-05),
- (2, 50, 50, 226, 5.7697296142578125e-05),
- (2, 50, 50, 209, 5.4836273193359375e-05),
- (2, 50, 50, 217, 5.507469177246094e-05),
- (2, 50, 50, 265, 5.817413330078125e-05),
- (2, 50, 50, 259, 5.7697296142578125e-05),
- (2, 50, 50, 245, 5.793571472167969e-05),
- (2, 50, 50, 234, 5.602836608886719e-05),
- (2, 50, 50, 249, 5.507469177246094e-05),
- (2, 50, 50, 255, 5.7220458984375e-05),
- (2, 100, 100, 468, 0.0004489421844482422),
- (2, 100, 100, 494, 0.00011587142944335938),
- (2, 100, 100, 476, 0.00011491775512695312),
- (2, 100, 100, 465, 0.00011110305786132812),
- (2, 100, 100, 540, 0.00011324882507324219),
- (2, 100, 100, 507, 0.00011181831359863281),
- (2, 100, 100, 503, 0.00011205673217773438),
- (2, 100, 100, 521, 0.00011181831359863281),
- (2, 100, 100, 507, 0.00011587142944335938),
- (2, 100, 100, 511, 0.0003619194030761719),
- (2, 500, 500, 2716, 0.000911712646484375),
- (2, 500, 500, 2706, 0.0007810592651367188),
- (2, 500, 500, 2747, 0.0007340908050537109),
- (2, 500, 500, 2734, 0.0007288455963134766),
- (2, 500, 500, 2788, 0.002050161361694336),
- (2, 500, 500, 2644, 0.0009469985961914062),
- (2, 500, 500, 2656, 0.0007669925689697266),
- (2, 500, 500, 2740, 0.0007197856903076172),
- (2, 500, 500, 2679, 0.0007522106170654297),
- (2, 500, 500, 2692, 0.0007650852203369141),
- (2, 1000, 1000, 5698, 0.0016472339630126953),
- (2, 1000, 1000, 5527, 0.0015230178833007812),
- (2, 1000, 1000, 5515, 0.0015628337860107422),
- (2, 1000, 1000, 5664, 0.002966165542602539),
- (2, 1000, 1000, 5625, 0.0015320777893066406),
- (2, 1000, 1000, 5700, 0.0016088485717773438),
- (2, 1000, 1000, 5578, 0.0017242431640625),
- (2, 1000, 1000, 5475, 0.0014820098876953125),
- (2, 1000, 1000, 5535, 0.001631021499633789),
- (2, 1000, 1000, 5578, 0.003248929977416992),
- (2, 2000, 2000, 11605, 0.0029668807983398438),
- (2, 2000, 2000, 11424, 0.003031015396118164),
- (2, 2000, 2000, 11566, 0.005472898483276367),
- (2, 2000, 2000, 11387, 0.0031888484954833984),
- (2, 2000, 2000, 11609, 0.003064870834350586),
- (2, 2000, 2000, 11517, 0.004862070083618164),
- (2, 2000, 2000, 11680, 0.0032231807708740234),
- (2, 2000, 2000, 11153, 0.0031337738037109375),
- (2, 2000, 2000, 11221, 0.00467991828918457),
- (2, 2000, 2000, 11347, 0.0029370784759521484),
- (2, 4000, 4000, 23691, 0.007688045501708984),
- (2, 4000, 4000, 23375, 0.006884098052978516),
- (2, 4000, 4000, 23653, 0.006844043731689453),
- (2, 4000, 4000, 23485, 0.006451129913330078),
- (2, 4000, 4000, 23511, 0.006535768508911133),
- (2, 4000, 4000, 23791, 0.005672931671142578),
- (2, 4000, 4000, 23664, 0.005640983581542969),
- (2, 4000, 4000, 22770, 0.005601167678833008),
- (2, 4000, 4000, 23244, 0.006595134735107422),
- (2, 4000, 4000, 23444, 0.006531715393066406),
- (2, 8000, 8000, 47924, 0.013878107070922852),
- (2, 8000, 8000, 47226, 0.013761043548583984),
- (2, 8000, 8000, 48097, 0.014080047607421875),
- (2, 8000, 8000, 47630, 0.015893936157226562),
- (2, 8000, 8000, 47605, 0.012578010559082031),
- (2, 8000, 8000, 48316, 0.012780904769897461),
- (2, 8000, 8000, 47725, 0.012787103652954102),
- (2, 8000, 8000, 47308, 0.013283729553222656),
- (2, 8000, 8000, 47579, 0.02372884750366211),
- (2, 8000, 8000, 47994, 0.012501955032348633),
- (3, 10, 10, 47, 1.7881393432617188e-05),
- (3, 10, 10, 58, 1.3828277587890625e-05),
- (3, 10, 10, 46, 1.1920928955078125e-05),
- (3, 10, 10, 44, 1.1920928955078125e-05),
- (3, 10, 10, 50, 1.0967254638671875e-05),
- (3, 10, 10, 53, 1.1682510375976562e-05),
- (3, 10, 10, 42, 1.2159347534179688e-05),
- (3, 10, 10, 46, 1.0967254638671875e-05),
- (3, 10, 10, 38, 1.0967254638671875e-05),
- (3, 10, 10, 36, 1.1205673217773438e-05),
- (3, 50, 50, 310, 6.604194641113281e-05),
- (3, 50, 50, 343, 6.604194641113281e-05),
- (3, 50, 50, 326, 6.29425048828125e-05),
- (3, 50, 50, 365, 6.508827209472656e-05),
- (3, 50, 50, 335, 6.222724914550781e-05),
- (3, 50, 50, 420, 6.914138793945312e-05),
- (3, 50, 50, 419, 6.914138793945312e-05),
- (3, 50, 50, 360, 6.389617919921875e-05),
- (3, 50, 50, 344, 6.341934204101562e-05),
- (3, 50, 50, 347, 6.29425048828125e-05),
- (3, 100, 100, 709, 0.0004150867462158203),
- (3, 100, 100, 700, 0.0001270771026611328),
- (3, 100, 100, 699, 0.0001227855682373047),
- (3, 100, 100, 764, 0.000125885009765625),
- (3, 100, 100, 723, 0.0001220703125),
- (3, 100, 100, 945, 0.0001518726348876953),
- (3, 100, 100, 847, 0.00014209747314453125),
- (3, 100, 100, 800, 0.0001380443572998047),
- (3, 100, 100, 734, 0.00012302398681640625),
- (3, 100, 100, 742, 0.0003941059112548828),
- (3, 500, 500, 4438, 0.0008709430694580078),
- (3, 500, 500, 4323, 0.0008440017700195312),
- (3, 500, 500, 4230, 0.0009548664093017578),
- (3, 500, 500, 4311, 0.0008878707885742188),
- (3, 500, 500, 4283, 0.0008409023284912109),
- (3, 500, 500, 4448, 0.0015492439270019531),
- (3, 500, 500, 4499, 0.0008499622344970703),
- (3, 500, 500, 4225, 0.0008220672607421875),
- (3, 500, 500, 4171, 0.0008678436279296875),
- (3, 500, 500, 4285, 0.0008518695831298828),
- (3, 1000, 1000, 8766, 0.0018470287322998047),
- (3, 1000, 1000, 8786, 0.0018410682678222656),
- (3, 1000, 1000, 8750, 0.001699209213256836),
- (3, 1000, 1000, 8985, 0.0033621788024902344),
- (3, 1000, 1000, 9045, 0.0017178058624267578),
- (3, 1000, 1000, 8816, 0.0016870498657226562),
- (3, 1000, 1000, 8905, 0.001683950424194336),
- (3, 1000, 1000, 8759, 0.0016870498657226562),
- (3, 1000, 1000, 8357, 0.0016407966613769531),
- (3, 1000, 1000, 8713, 0.0032927989959716797),
- (3, 2000, 2000, 17708, 0.003568887710571289),
- (3, 2000, 2000, 17972, 0.003859996795654297),
- (3, 2000, 2000, 17931, 0.005510091781616211),
- (3, 2000, 2000, 17977, 0.003278970718383789),
- (3, 2000, 2000, 17848, 0.00321197509765625),
- (3, 2000, 2000, 17796, 0.005075216293334961),
- (3, 2000, 2000, 17989, 0.0033011436462402344),
- (3, 2000, 2000, 18167, 0.003300905227661133),
- (3, 2000, 2000, 17199, 0.004881381988525391),
- (3, 2000, 2000, 17519, 0.0032227039337158203),
- (3, 4000, 4000, 35929, 0.008861780166625977),
- (3, 4000, 4000, 36469, 0.008013725280761719),
- (3, 4000, 4000, 36688, 0.017304658889770508),
- (3, 4000, 4000, 36715, 0.007154941558837891),
- (3, 4000, 4000, 35682, 0.00683903694152832),
- (3, 4000, 4000, 36679, 0.006747245788574219),
- (3, 4000, 4000, 35996, 0.007889032363891602),
- (3, 4000, 4000, 36256, 0.007970809936523438),
- (3, 4000, 4000, 35811, 0.007636070251464844),
- (3, 4000, 4000, 35900, 0.007786989212036133),
- (3, 8000, 8000, 72386, 0.016496896743774414),
- (3, 8000, 8000, 73397, 0.015348196029663086),
- (3, 8000, 8000, 74349, 0.02313399314880371),
- (3, 8000, 8000, 73449, 0.015166044235229492),
- (3, 8000, 8000, 73235, 0.01461029052734375),
- (3, 8000, 8000, 73412, 0.014788150787353516),
- (3, 8000, 8000, 74452, 0.0163118839263916),
- (3, 8000, 8000, 73922, 0.024094343185424805),
- (3, 8000, 8000, 72902, 0.015069961547851562),
- (3, 8000, 8000, 72920, 0.014713764190673828)]
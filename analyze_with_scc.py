@@ -1,84 +1,297 @@
 #!/usr/bin/env python3
 
+import argparse
 import csv
-from scc import GRAPH, find_sccs, prepost, classify_edges
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, compress
 
-def load_wiki_graph(file_path: str, vote_filter=None) -> GRAPH:
+from graph_file import open_graph_file, write_graph_file
+from sampling import sample_subgraph
+from scc import GRAPH, CSRGraph, AnalysisSession, count_edge_classes, NODE_TYPECODE, OFFSET_TYPECODE
+from scc_cache import ResultCache
+
+class WikiVotes:
+    """
+    Every vote in the Wiki RfA dataset, loaded in a single pass.
+    Each distinct (source, target, vote) appears once, in order of first appearance,
+    as one entry of the shared sources, targets and votes arrays. Vote-filtered graphs
+    are selected by masks over those arrays, and graph() builds each one as a new graph.
+    """
+
+    def __init__(self, labels: list[str], sources: array, targets: array, votes: array):
+        self.labels = labels
+        self.sources = sources
+        self.targets = targets
+        self.votes = votes
+
+    def __len__(self) -> int:
+        return len(self.votes)
+
+    def edge_mask(self, vote_filter=None, predicate=None) -> bytearray:
+        """
+        Return a mask selecting the votes equal to vote_filter, or for which
+        predicate(vote) is true. With neither, select every vote.
+        """
+        if predicate is None:
+            if vote_filter is None:
+                return bytearray(b'\x01') * len(self.votes)
+            predicate = vote_filter.__eq__
+        return bytearray(map(bool, map(predicate, self.votes)))
+
+    def graph(self, mask: bytearray | None = None, csr: bool = False) -> GRAPH | CSRGraph:
+        """
+        Build the graph of the votes selected by mask (all votes by default), with the
+        nodes, key order and adjacency order that load_wiki_graph gives for that filter.
+        The result is a copy: its labels and edges do not share these arrays.
+        """
+        labels, sources, targets = self.labels, self.sources, self.targets
+        local_ids = array(NODE_TYPECODE, [-1]) * len(labels)
+        view_labels: list[str] = []
+        edge_sources = array(NODE_TYPECODE)
+        edge_targets = array(NODE_TYPECODE)
+        
+        # 1. number the nodes in order of first appearance among the selected votes
+        selected = range(len(sources)) if mask is None else compress(range(len(sources)), mask)
+        for i in selected:
+            source = local_ids[sources[i]]
+            if source < 0:
+                source = local_ids[sources[i]] = len(view_labels)
+                view_labels.append(labels[sources[i]])
+            target = local_ids[targets[i]]
+            if target < 0:
+                target = local_ids[targets[i]] = len(view_labels)
+                view_labels.append(labels[targets[i]])
+            edge_sources.append(source)
+            edge_targets.append(target)
+        del local_ids
+        
+        # 2. counting sort the edges by source; each row keeps the order of its votes
+        n = len(view_labels)
+        offsets = array(OFFSET_TYPECODE, [0]) * (n + 1)
+        for source in edge_sources:
+            offsets[source + 1] += 1
+        offsets = array(OFFSET_TYPECODE, accumulate(offsets))
+        cursor = offsets[:n]
+        row_targets = array(NODE_TYPECODE, [0]) * len(edge_targets)
+        for source, target in zip(edge_sources, edge_targets):
+            row_targets[cursor[source]] = target
+            cursor[source] += 1
+        del edge_sources, edge_targets, cursor
+        
+        # 3. votes of different sign on the same pair are one edge: keep the first
+        #    of each target in its row, compacting the rows in place
+        last_row = array(NODE_TYPECODE, [-1]) * n
+        end = 0
+        for source in range(n):
+            start, stop = offsets[source], offsets[source + 1]
+            offsets[source] = end
+            for target in row_targets[start:stop]:
+                if last_row[target] != source:
+                    last_row[target] = source
+                    row_targets[end] = target
+                    end += 1
+        offsets[n] = end
+        del row_targets[end:]
+        
+        graph = CSRGraph(view_labels, offsets, row_targets)
+        return graph if csr else graph.to_graph()
+
+
+def load_wiki_votes(file_path: str) -> WikiVotes:
+    """
+    Read the Wiki RfA CSV once, keeping the vote sign of every edge.
+    """
+    # Node labels are interned to integer ids in order of first appearance
+    ids: dict[str, int] = {}
+    labels: list[str] = []
+    sources = array(NODE_TYPECODE)
+    targets = array(NODE_TYPECODE)
+    votes = array('b')
+    seen_votes: set[tuple[int, int, str]] = set()
+    
+    with open(file_path, 'r', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        source_column = header.index('SOURCE')
+        target_column = header.index('TARGET')
+        vote_column = header.index('VOTE')
+        
+        for row in reader:
+            source = ids.get(row[source_column])
+            if source is None:
+                source = ids[row[source_column]] = len(labels)
+                labels.append(row[source_column])
+            
+            target = ids.get(row[target_column])
+            if target is None:
+                target = ids[row[target_column]] = len(labels)
+                labels.append(row[target_column])
+            
+            key = (source, target, row[vote_column])
+            if key not in seen_votes:
+                seen_votes.add(key)
+                sources.append(source)
+                targets.append(target)
+                votes.append(int(row[vote_column]))
+    
+    return WikiVotes(labels, sources, targets, votes)
+
+
+def load_wiki_graph(file_path: str, vote_filter=None, csr: bool = False) -> GRAPH | CSRGraph:
     """
     Load the Wiki RfA dataset and convert it to GRAPH format.
     
     Args:
         file_path: Path to the wikiRfA.csv file
         vote_filter: Optional filter for VOTE column (1 for positive votes, -1 for negative, 0 for neutral)
+        csr: Return a CSRGraph instead of a GRAPH
     
     Returns:
         GRAPH: Dictionary mapping source nodes to lists of target nodes
     """
-    graph: GRAPH = {}
-    
-    with open(file_path, 'r') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            source = row['SOURCE']
-            target = row['TARGET']
-            vote = int(row['VOTE'])
-            
-            # Apply vote filter if specified
-            if vote_filter is not None and vote != vote_filter:
-                continue
-            
-            # Initialize source node if not exists
-            if source not in graph:
-                graph[source] = []
-            
-            # Add edge from source to target
-            if target not in graph[source]:
-                graph[source].append(target)
-            
-            # Ensure target node exists (even if it has no outgoing edges)
-            if target not in graph:
-                graph[target] = []
-    
-    return graph
+    votes = load_wiki_votes(file_path)
+    return votes.graph(votes.edge_mask(vote_filter), csr)
+
 
-def get_sample_subgraph(graph: GRAPH, max_size: int = 100) -> GRAPH:
+def get_sample_subgraph(graph: GRAPH | CSRGraph, max_size: int = 100) -> GRAPH:
     """Get a smaller connected subgraph for detailed analysis"""
     if len(graph) <= max_size:
-        return graph
+        return graph.to_graph() if isinstance(graph, CSRGraph) else graph
+    
+    # Breadth-first from the first few nodes (see sampling.py for other strategies)
+    return sample_subgraph(graph, max_size, strategy='bfs')
+
+def analyze_graph(graph_name: str, graph: GRAPH | CSRGraph, do_detailed: bool,
+                  cache: ResultCache | None = None) -> str:
+    """
+    Run the SCC analysis for one graph and return its report section.
+    With a cache, results for a graph seen before are read from disk.
+    """
+    lines: list[str] = []
+    out = lines.append
+    
+    out(f"\n{'='*60}")
+    out(f"{graph_name}")
+    out(f"{'='*60}")
+    
+    if len(graph) == 0:
+        out("❌ Empty graph, skipping...")
+        return "\n".join(lines)
         
-    subgraph: GRAPH = {}
-    visited = set()
-    start_nodes = list(graph.keys())[:3]  # Start from first few nodes
-    queue = start_nodes.copy()
-    
-    while queue and len(subgraph) < max_size:
-        node = queue.pop(0)
-        if node in visited:
-            continue
-            
-        visited.add(node)
-        if node in graph:
-            subgraph[node] = graph[node].copy()
-            # Add neighbors to queue
-            for neighbor in graph[node]:
-                if neighbor not in visited and len(subgraph) < max_size:
-                    queue.append(neighbor)
+    # Basic stats
+    if isinstance(graph, CSRGraph):
+        total_edges = graph.num_edges
+    else:
+        total_edges = sum(len(neighbors) for neighbors in graph.values())
+    out(f"📈 Nodes: {len(graph):,}")
+    out(f"🔗 Edges: {total_edges:,}")
+    out(f"📊 Avg degree: {total_edges/len(graph):.2f}")
+    
+    # Find SCCs using your function
+    out(f"\n🔍 Finding strongly connected components...")
+    session = AnalysisSession(graph)
+    summary = cache.scc_summary(graph) if cache else session.summary
+    out(f"🎯 Number of SCCs: {summary.count}")
+    
+    # Analyze SCC sizes
+    out(f"\n🏆 Top 5 largest SCCs:")
+    for i, (component, size, members) in enumerate(summary.top_components(5, sample_size=10)):
+        if size > 1:  # Only show non-trivial SCCs
+            out(f"  🔸 SCC {i+1}: {size} nodes")
+            if size <= 10:  # Show members if small enough
+                out(f"    👥 Members: {members}")
+            else:
+                sample = members[:5]
+                out(f"    👥 Sample: {sample}...")
+        else:
+            break
+    
+    # Count trivial vs non-trivial SCCs
+    trivial_sccs = summary.size_histogram.get(1, 0)
+    non_trivial_sccs = summary.count - trivial_sccs
+    out(f"\n📊 SCC Summary:")
+    out(f"  • Trivial SCCs (size 1): {trivial_sccs}")
+    out(f"  • Non-trivial SCCs (size > 1): {non_trivial_sccs}")
     
-    return subgraph
+    # Detailed analysis for small graphs
+    if do_detailed and len(graph) <= 100:
+        out(f"\n🔬 Detailed Analysis:")
+        
+        # DFS Trees
+        trees = cache.prepost(graph) if cache else session.prepost
+        out(f"🌳 DFS trees: {len(trees)}")
+        
+        # Show some prepost numbers
+        out(f"⏱️  Sample prepost numbers:")
+        count = 0
+        for tree in trees[:2]:  # First 2 trees
+            for node, times in list(tree.items())[:5]:  # First 5 nodes per tree
+                out(f"    {node}: pre={times[0]}, post={times[1]}")
+                count += 1
+            if count >= 10:
+                break
+        
+        # Edge Classification
+        out(f"\n🏷️  Classifying edges...")
+        if cache:
+            edge_counts = count_edge_classes(graph, cache.edge_class_codes(graph))
+        else:
+            edge_counts = session.classify_edges(counts_only=True)
+        
+        tree_forward = edge_counts['tree/forward']
+        back = edge_counts['back']
+        cross = edge_counts['cross']
+        total_classified = tree_forward + back + cross
+        
+        out(f"  🔸 Tree/Forward edges: {tree_forward}")
+        out(f"  🔙 Back edges: {back}")
+        out(f"  ↔️  Cross edges: {cross}")
+        out(f"  📊 Total classified: {total_classified}")
+        
+        if total_classified > 0:
+            out(f"  📈 Edge distribution:")
+            out(f"    • Tree/Forward: {tree_forward/total_classified*100:.1f}%")
+            out(f"    • Back: {back/total_classified*100:.1f}%") 
+            out(f"    • Cross: {cross/total_classified*100:.1f}%")
+    
+    elif len(graph) > 100:
+        out(f"⚠️  Skipping detailed analysis (graph too large: {len(graph)} nodes)")
+    
+    return "\n".join(lines)
+
+
+def _analyze_graph_job(job: tuple[str, GRAPH | str, bool, str | None]) -> str:
+    # Large graphs arrive as the path of a graph file, which the worker memory-maps
+    graph_name, graph, do_detailed, cache_directory = job
+    if isinstance(graph, str):
+        graph = open_graph_file(graph)
+    cache = ResultCache(cache_directory) if cache_directory else None
+    return analyze_graph(graph_name, graph, do_detailed, cache)
+
+
+DATASET_PATH = "/Users/jakenef/.cache/kagglehub/datasets/boneacrabonjac/wiki-rfa/versions/1/wikiRfA.csv"
+
 
-def analyze_wiki_with_scc():
-    """Analyze the Wiki RfA graph using the original SCC functions"""
-    dataset_path = "/Users/jakenef/.cache/kagglehub/datasets/boneacrabonjac/wiki-rfa/versions/1/wikiRfA.csv"
+def analyze_wiki_with_scc(dataset_path: str = DATASET_PATH, workers: int = 1,
+                          cache_directory: str | None = None):
+    """
+    Analyze the Wiki RfA graph using the original SCC functions.
+    With more than one worker, the graph variants are analyzed concurrently in a process pool.
+    With a cache directory, results from earlier runs on unchanged graphs are reused.
+    """
     
     print("🔍 Loading Wiki RfA dataset using your SCC functions...")
     print("=" * 60)
     
-    # Load different versions of the graph
+    # Load the votes once and derive each version of the graph from them
     print("📊 Loading different graph variants...")
-    all_votes_graph = load_wiki_graph(dataset_path)
-    positive_votes_graph = load_wiki_graph(dataset_path, vote_filter=1)
-    negative_votes_graph = load_wiki_graph(dataset_path, vote_filter=-1)
+    votes = load_wiki_votes(dataset_path)
+    all_votes_graph = votes.graph(csr=True)
+    positive_votes_graph = votes.graph(votes.edge_mask(1), csr=True)
+    negative_votes_graph = votes.graph(votes.edge_mask(-1), csr=True)
     
     print(f"✅ All votes graph: {len(all_votes_graph)} nodes")
     print(f"✅ Positive votes graph: {len(positive_votes_graph)} nodes") 
@@ -96,90 +309,36 @@ def analyze_wiki_with_scc():
         ("👎 Negative Votes Graph", negative_votes_graph, False)
     ]
     
-    for graph_name, graph, do_detailed in graphs_to_analyze:
-        print(f"\n{'='*60}")
-        print(f"{graph_name}")
-        print(f"{'='*60}")
-        
-        if len(graph) == 0:
-            print("❌ Empty graph, skipping...")
-            continue
-            
-        # Basic stats
-        total_edges = sum(len(neighbors) for neighbors in graph.values())
-        print(f"📈 Nodes: {len(graph):,}")
-        print(f"🔗 Edges: {total_edges:,}")
-        print(f"📊 Avg degree: {total_edges/len(graph):.2f}")
-        
-        # Find SCCs using your function
-        print(f"\n🔍 Finding strongly connected components...")
-        sccs = find_sccs(graph)
-        print(f"🎯 Number of SCCs: {len(sccs)}")
-        
-        # Analyze SCC sizes
-        scc_sizes = [(len(scc), scc) for scc in sccs]
-        scc_sizes.sort(reverse=True)
-        
-        print(f"\n🏆 Top 5 largest SCCs:")
-        for i, (size, scc) in enumerate(scc_sizes[:5]):
-            if size > 1:  # Only show non-trivial SCCs
-                print(f"  🔸 SCC {i+1}: {size} nodes")
-                if size <= 10:  # Show members if small enough
-                    members = sorted(list(scc))
-                    print(f"    👥 Members: {members}")
-                else:
-                    sample = sorted(list(scc))[:5]
-                    print(f"    👥 Sample: {sample}...")
-            else:
-                break
-        
-        # Count trivial vs non-trivial SCCs
-        trivial_sccs = sum(1 for scc in sccs if len(scc) == 1)
-        non_trivial_sccs = len(sccs) - trivial_sccs
-        print(f"\n📊 SCC Summary:")
-        print(f"  • Trivial SCCs (size 1): {trivial_sccs}")
-        print(f"  • Non-trivial SCCs (size > 1): {non_trivial_sccs}")
-        
-        # Detailed analysis for small graphs
-        if do_detailed and len(graph) <= 100:
-            print(f"\n🔬 Detailed Analysis:")
-            
-            # DFS Trees
-            trees = prepost(graph)
-            print(f"🌳 DFS trees: {len(trees)}")
-            
-            # Show some prepost numbers
-            print(f"⏱️  Sample prepost numbers:")
-            count = 0
-            for tree in trees[:2]:  # First 2 trees
-                for node, times in list(tree.items())[:5]:  # First 5 nodes per tree
-                    print(f"    {node}: pre={times[0]}, post={times[1]}")
-                    count += 1
-                if count >= 10:
-                    break
-            
-            # Edge Classification
-            print(f"\n🏷️  Classifying edges...")
-            edge_classification = classify_edges(graph, trees)
-            
-            tree_forward = len(edge_classification['tree/forward'])
-            back = len(edge_classification['back'])
-            cross = len(edge_classification['cross'])
-            total_classified = tree_forward + back + cross
-            
-            print(f"  🔸 Tree/Forward edges: {tree_forward}")
-            print(f"  🔙 Back edges: {back}")
-            print(f"  ↔️  Cross edges: {cross}")
-            print(f"  📊 Total classified: {total_classified}")
-            
-            if total_classified > 0:
-                print(f"  📈 Edge distribution:")
-                print(f"    • Tree/Forward: {tree_forward/total_classified*100:.1f}%")
-                print(f"    • Back: {back/total_classified*100:.1f}%") 
-                print(f"    • Cross: {cross/total_classified*100:.1f}%")
+    if workers <= 1:
+        cache = ResultCache(cache_directory) if cache_directory else None
+        for graph_name, graph, do_detailed in graphs_to_analyze:
+            print(analyze_graph(graph_name, graph, do_detailed, cache))
+        return
+    
+    # Share the large graphs with the workers through memory-mapped graph files
+    # rather than pickling them; reports are printed in the original order
+    with tempfile.TemporaryDirectory() as directory, ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = []
+        for i, (graph_name, graph, do_detailed) in enumerate(graphs_to_analyze):
+            if isinstance(graph, CSRGraph):
+                path = os.path.join(directory, f'variant{i}.csr')
+                write_graph_file(path, graph)
+                graph = path
+            jobs.append((graph_name, graph, do_detailed, cache_directory))
         
-        elif len(graph) > 100:
-            print(f"⚠️  Skipping detailed analysis (graph too large: {len(graph)} nodes)")
+        for report in pool.map(_analyze_graph_job, jobs):
+            print(report)
 
 if __name__ == "__main__":
-    analyze_wiki_with_scc()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Analyze the Wiki RfA vote graph with the SCC functions")
+    parser.add_argument("dataset_path", nargs="?", default=DATASET_PATH, help="path to wikiRfA.csv")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="analyze graph variants in this many processes (0 = one per CPU, default: 1)"
+    )
+    parser.add_argument(
+        "--cache", metavar="DIR",
+        help="reuse SCC, prepost and edge-class results stored in this directory"
+    )
+    args = parser.parse_args()
+    analyze_wiki_with_scc(args.dataset_path, args.workers or os.cpu_count(), args.cache)
\ No newline at end of file
@@ -0,0 +1,44 @@
+import gc
+import statistics
+from time import perf_counter_ns
+from typing import Callable
+
+
+def measure(analyze: Callable, graph, repeats: int = 5, warmup: int = 1) -> list[int]:
+    """
+    Return `repeats` wall-clock times, in nanoseconds, of analyze(graph).
+    The call runs `warmup` times untimed first. The garbage collector is run
+    beforehand and kept off while timing, so a collection triggered by an
+    earlier allocation is not charged to this call.
+    """
+    if repeats < 1:
+        raise ValueError(f'repeats must be at least 1, got {repeats}')
+
+    for _ in range(warmup):
+        analyze(graph)
+
+    gcWasEnabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        samples = []
+        for _ in range(repeats):
+            start = perf_counter_ns()
+            analyze(graph)
+            samples.append(perf_counter_ns() - start)
+    finally:
+        if gcWasEnabled:
+            gc.enable()
+
+    return samples
+
+
+def summarize(samples: list[float]) -> tuple[float, float, float]:
+    """
+    Return the min, median and interquartile range of samples.
+    """
+    if len(samples) < 2:
+        return min(samples), samples[0], 0
+
+    q1, median, q3 = statistics.quantiles(samples, n=4, method='inclusive')
+    return min(samples), median, q3 - q1
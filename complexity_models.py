@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+# Candidate cost models: the terms each multiplies by a fitted coefficient. Every
+# model also gets a constant term for the per-call overhead.
+CANDIDATE_MODELS = {
+    'V+E': lambda v, e: [v + e],
+    'V log V + E': lambda v, e: [v * np.log2(np.maximum(v, 2)) + e],
+    '(V+E) log V': lambda v, e: [(v + e) * np.log2(np.maximum(v, 2))],
+    'aV + bE': lambda v, e: [v, e],
+}
+
+
+@dataclass
+class ModelFit:
+    """
+    One cost model fitted to runtimes: seconds ~ constant + sum(coefficient * term).
+    Residuals are relative, (observed - predicted) / observed, in the order of the rows.
+    """
+    name: str
+    constant: float
+    coefficients: list[float]
+    residuals: np.ndarray
+    aic: float  # Akaike information criterion of the weighted fit; lower is better
+
+    @property
+    def rms_residual(self) -> float:
+        return float(np.sqrt(np.mean(self.residuals ** 2)))
+
+    @property
+    def max_residual(self) -> float:
+        return float(np.max(np.abs(self.residuals)))
+
+    def predict(self, v, e):
+        """Return the predicted seconds for V = v and E = e (scalars or arrays)"""
+        v, e = np.asarray(v, dtype=float), np.asarray(e, dtype=float)
+        terms = CANDIDATE_MODELS[self.name](v, e)
+        return self.constant + sum(c * term for c, term in zip(self.coefficients, terms))
+
+
+def fit_model(name: str, runtimes: list[tuple]) -> ModelFit:
+    """
+    Fit the named model to (density, size, V, E, seconds) rows by weighted least squares.
+    Each row is weighted by 1 / seconds, so the fit minimizes relative rather than
+    absolute error: the many fast, noisy small graphs and the few slow large ones
+    pull on it equally.
+    """
+    table = np.asarray([row[2:5] for row in runtimes], dtype=float)
+    v, e, seconds = table.T
+
+    design = np.column_stack([np.ones_like(v)] + CANDIDATE_MODELS[name](v, e))
+    weights = 1 / seconds
+    solution, *_ = np.linalg.lstsq(design * weights[:, None], seconds * weights, rcond=None)
+
+    residuals = (seconds - design @ solution) / seconds
+    n, k = design.shape
+    rss = max(float(residuals @ residuals), np.finfo(float).tiny)
+    return ModelFit(
+        name=name,
+        constant=float(solution[0]),
+        coefficients=[float(c) for c in solution[1:]],
+        residuals=residuals,
+        aic=n * np.log(rss / n) + 2 * k,
+    )
+
+
+def fit_models(runtimes: list[tuple], names=None) -> list[ModelFit]:
+    """
+    Fit every candidate model (or the named ones) and return them best first, by AIC,
+    which trades goodness of fit against the number of coefficients.
+    """
+    if names is None:
+        names = CANDIDATE_MODELS
+    return sorted((fit_model(name, runtimes) for name in names), key=lambda fit: fit.aic)
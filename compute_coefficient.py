@@ -1,5 +1,6 @@
-import matplotlib.pyplot as plt
-from _runtimes import runtimes
+import argparse
+
+from runtime_data import RESULTS_PATH, ResultTable, load_results
 
 
 def compute_coefficient(observed_performance, theoretical_order):
@@ -8,9 +9,49 @@ def compute_coefficient(observed_performance, theoretical_order):
     ]
 
 
-def main():
-    def theoretical_big_o(v, e):
-        return v + e
+def theoretical_big_o(v, e):
+    return v + e
+
+
+def select_results(results: ResultTable, algorithm: str | None = None, revision: str | None = None,
+                   run: str | None = None) -> ResultTable:
+    """
+    Return the results matching the given algorithm, revision and run timestamp;
+    each one left as None matches everything.
+    """
+    filters = {'algorithm': algorithm, 'revision': revision, 'timestamp': run}
+    return results.where(**{name: value for name, value in filters.items() if value is not None})
+
+
+def compare_runs(results: ResultTable):
+    """Print the mean coefficient of every run in results, oldest first"""
+    for run in results.runs():
+        rows = results.where(timestamp=run)
+        coeffs = compute_coefficient(rows.runtimes(), theoretical_big_o)
+        print(f"{run}  {rows['algorithm'][0]:<10} {rows['revision'][0]:<10} "
+              f"{sum(coeffs) / len(coeffs):.4g}  ({rows['machine'][0]})")
+
+
+def print_model_fits(runtimes):
+    """Fit each candidate cost model by weighted least squares and print them best first"""
+    # NumPy is only needed for the fit
+    from complexity_models import fit_models
+
+    fits = fit_models(runtimes)
+    print(f"{'Model':<14} {'Constant (s)':>12}  {'Coefficients':<22} {'RMS rel. resid.':>15} "
+          f"{'Max rel. resid.':>15} {'AIC':>9}")
+    for fit in fits:
+        coefficients = ', '.join(f'{c:.4g}' for c in fit.coefficients)
+        print(f'{fit.name:<14} {fit.constant:>12.4g}  {coefficients:<22} {fit.rms_residual:>15.3f} '
+              f'{fit.max_residual:>15.3f} {fit.aic:>9.1f}')
+    print(f'Best model: {fits[0].name}')
+
+
+def main(path: str = RESULTS_PATH, plot: bool = True, fit: bool = False, **filters):
+    results = select_results(load_results(path), **filters)
+    if len(results) == 0:
+        raise SystemExit(f'No results in {path} match {filters}')
+    runtimes = results.latest().runtimes()
 
     coeffs = compute_coefficient(runtimes, theoretical_big_o)
 
@@ -20,6 +61,16 @@ def main():
     coeff = sum(used_coeffs) / len(used_coeffs)
     print(coeff)
 
+    if fit:
+        print()
+        print_model_fits(runtimes)
+
+    if not plot:
+        return
+
+    # matplotlib takes longer to import than everything else here combined
+    import matplotlib.pyplot as plt
+
     plt.bar(range(len(coeffs)), coeffs)
     xlim = plt.xlim()
     plt.plot(xlim, [coeff, coeff], ls=':', c='k')
@@ -29,4 +80,26 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(
+        description='Estimate the constant factor of the measured runtimes (of the latest matching run)'
+    )
+    parser.add_argument(
+        'results', nargs='?', default=RESULTS_PATH,
+        help=f'results file written by run_scc_analysis.py (default: {RESULTS_PATH})'
+    )
+    parser.add_argument('--algorithm', help='only use runs of this algorithm, e.g. find_sccs')
+    parser.add_argument('--revision', help='only use runs of this git revision')
+    parser.add_argument('--run', help='use the run with this timestamp')
+    parser.add_argument('--compare', action='store_true', help='print the coefficient of every matching run')
+    parser.add_argument(
+        '--fit', action='store_true',
+        help='also fit the candidate cost models by weighted least squares (needs NumPy)'
+    )
+    parser.add_argument('--no-plot', action='store_true', help='only print the coefficient')
+    args = parser.parse_args()
+
+    if args.compare:
+        compare_runs(select_results(load_results(args.results), args.algorithm, args.revision, args.run))
+    else:
+        main(args.results, plot=not args.no_plot, fit=args.fit,
+             algorithm=args.algorithm, revision=args.revision, run=args.run)
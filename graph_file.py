@@ -0,0 +1,106 @@
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+from scc import GRAPH, CSRGraph, as_csr, NODE_TYPECODE, OFFSET_TYPECODE
+
+# Graph files hold a CSRGraph as five little-endian sections:
+#   header          magic, node count, edge count, label blob size
+#   label offsets   (n + 1) uint64 byte offsets into the label blob
+#   label blob      the UTF-8 labels back to back, zero-padded to 8 bytes
+#   offsets         (n + 1) int64 CSR offsets
+#   targets         m int32 node ids
+GRAPH_FILE_MAGIC = b'SCCCSR01'
+_HEADER = struct.Struct('<8sQQQ')
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+class LabelTable(Sequence):
+    """
+    The node labels of a graph file, decoded from the mapped label blob on access.
+    """
+
+    def __init__(self, label_offsets: memoryview, blob: memoryview):
+        self._offsets = label_offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return str(self._blob[self._offsets[i]:self._offsets[i + 1]], 'utf-8')
+
+
+def write_graph_file(path: str, graph: GRAPH | CSRGraph) -> None:
+    """
+    Write graph to path in the graph file format.
+    """
+    if sys.byteorder != 'little':
+        raise NotImplementedError('graph files are written in native little-endian byte order')
+
+    csr = as_csr(graph)
+    encoded = [label.encode('utf-8') for label in csr.labels]
+    label_offsets = array('Q', [0])
+    total = 0
+    for label in encoded:
+        total += len(label)
+        label_offsets.append(total)
+
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(GRAPH_FILE_MAGIC, len(csr), csr.num_edges, total))
+        file.write(label_offsets.tobytes())
+        for label in encoded:
+            file.write(label)
+        file.write(bytes(_padding(total)))
+        file.write(array(OFFSET_TYPECODE, csr.offsets))
+        file.write(array(NODE_TYPECODE, csr.targets))
+
+
+def open_graph_file(path: str) -> CSRGraph:
+    """
+    Memory-map a graph file and return it as a CSRGraph without copying it.
+    The offsets and targets are memoryviews over the mapping and labels are decoded
+    on demand, so prepost, find_sccs and classify_edges can run on graphs larger
+    than the Python objects for them would allow.
+    """
+    if sys.byteorder != 'little':
+        raise NotImplementedError('graph files are read in native little-endian byte order')
+
+    with open(path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapping)
+    magic, n, m, blob_size = _HEADER.unpack_from(view)
+    if magic != GRAPH_FILE_MAGIC:
+        raise ValueError(f'{path} is not a graph file')
+
+    position = _HEADER.size
+    sections = []
+    for size in (8 * (n + 1), blob_size + _padding(blob_size), 8 * (n + 1), 4 * m):
+        sections.append(view[position:position + size])
+        position += size
+    label_offsets, blob, offsets, targets = sections
+
+    return CSRGraph(
+        LabelTable(label_offsets.cast('Q'), blob[:blob_size]),
+        offsets.cast(OFFSET_TYPECODE),
+        targets.cast(NODE_TYPECODE)
+    )
+
+
+def wiki_csv_to_graph_file(csv_path: str, path: str, vote_filter=None) -> None:
+    """
+    Load the Wiki RfA CSV with load_wiki_graph and write it as a graph file.
+    """
+    from analyze_with_scc import load_wiki_graph
+
+    write_graph_file(path, load_wiki_graph(csv_path, vote_filter))
@@ -1,7 +1,11 @@
 import math
 import random
+import struct
+from array import array
 from random import gammavariate, sample
 
+from scc import GRAPH, CSRGraph, NODE_TYPECODE, OFFSET_TYPECODE
+
 
 def _get_neighbor(i, n, density_factor) -> int:
     step = random.gauss(0, n ** (0.15 * density_factor))
@@ -30,14 +34,156 @@ def _get_neighbor(i, n, density_factor) -> int:
 
 def generate_graph(n: int, density_factor: float) -> dict[str, list[str]]:
     graph = {}
+    width = len(str(n))
 
     for i in range(1, n + 1):
-        node = f"n{i:0{len(str(n))}d}"
+        node = f"n{i:0{width}d}"
         num_edges = min(n, math.ceil(gammavariate(1.5, 2.0 * density_factor)))
         neighbors = {
-            f"n{_get_neighbor(i, n, density_factor):0{len(str(n))}d}"
+            f"n{_get_neighbor(i, n, density_factor):0{width}d}"
             for _ in range(num_edges)
         }
         graph[node] = list(sorted(neighbors))
 
-    return graph
\ No newline at end of file
+    return graph
+
+
+def _vectorized_edges(rng, first: int, last: int, n: int, density_factor: float):
+    """
+    Draw the edges of nodes first..last (1-based, inclusive) of an n-node graph.
+    Return sorted, deduplicated 0-based (sources, targets) arrays.
+    """
+    import numpy as np
+
+    degrees = np.minimum(n, np.ceil(rng.gamma(1.5, 2.0 * density_factor, size=last - first + 1))).astype(np.int64)
+    sources = np.repeat(np.arange(first, last + 1), degrees)
+
+    # Round each step up, respecting sign, then apply _get_neighbor's rules
+    steps = rng.normal(0, n ** (0.15 * density_factor), size=len(sources))
+    candidates = sources + np.copysign(np.ceil(np.abs(steps)), steps).astype(np.int64)
+    candidates[candidates > n] -= n
+    candidates[candidates < 0] += n
+    # A step of more than n can still leave the range; keep such edges on a real node
+    # before the rules below, so they cannot undo the end nodes' self-loop rules
+    np.clip(candidates, 0, n, out=candidates)
+    candidates[candidates == 0] = 1
+    candidates[(sources == 1) & (candidates == 1)] += 1
+    candidates[(sources == n) & (candidates == n)] -= 1
+
+    # Sorting combined keys removes duplicate edges and orders each row's targets
+    keys = np.unique(sources * (n + 1) + candidates)
+    sources, targets = np.divmod(keys, n + 1)
+    return (sources - 1).astype(np.int32), (targets - 1).astype(np.int32)
+
+
+def _node_labels(n: int) -> list[str]:
+    width = len(str(n))
+    return [f"n{i:0{width}d}" for i in range(1, n + 1)]
+
+
+def generate_graph_vectorized(n: int, density_factor: float, seed: int | None = None,
+                              csr: bool = False) -> GRAPH | CSRGraph:
+    """
+    Generate a graph from the same distribution as generate_graph, drawing all degrees
+    and neighbor steps at once with NumPy.
+    The graph is reproducible from seed, but it is not the graph generate_graph
+    would build after random.seed(seed), since the random streams differ.
+    With csr, return a CSRGraph built straight from the arrays instead of a GRAPH.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    labels = _node_labels(n)
+    sources, targets = _vectorized_edges(rng, 1, n, n, density_factor)
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+
+    if csr:
+        return CSRGraph(
+            labels,
+            array(OFFSET_TYPECODE, offsets.tobytes()),
+            array(NODE_TYPECODE, targets.tobytes())
+        )
+
+    bounds = offsets.tolist()
+    targetList = targets.tolist()
+    return {
+        labels[u]: [labels[v] for v in targetList[bounds[u]:bounds[u + 1]]]
+        for u in range(n)
+    }
+
+
+# Edge files: this magic, the node count as a little-endian uint64, then one
+# little-endian int32 (source, target) pair per edge, sorted by source.
+# Node ids are 0-based and labeled like generate_graph's nodes.
+EDGE_FILE_MAGIC = b'SCCEDGE1'
+_EDGE_FILE_HEADER = struct.Struct('<8sQ')
+
+
+def write_graph_chunks(path: str, n: int, density_factor: float, seed: int,
+                       chunk_size: int = 1_000_000) -> int:
+    """
+    Generate an n-node graph chunk_size nodes at a time and stream its edges to an
+    edge file at path, so the whole graph never has to fit in memory.
+    Each chunk draws from its own generator keyed by (seed, first node), so a file is
+    reproducible from seed and chunk_size. Return the number of edges written.
+    """
+    import numpy as np
+
+    edges = 0
+    with open(path, 'wb') as file:
+        file.write(_EDGE_FILE_HEADER.pack(EDGE_FILE_MAGIC, n))
+        for first in range(1, n + 1, chunk_size):
+            last = min(n, first + chunk_size - 1)
+            rng = np.random.default_rng([seed, first])
+            sources, targets = _vectorized_edges(rng, first, last, n, density_factor)
+
+            pairs = np.empty((len(sources), 2), dtype='<i4')
+            pairs[:, 0] = sources
+            pairs[:, 1] = targets
+            pairs.tofile(file)
+            edges += len(pairs)
+
+    return edges
+
+
+def load_edge_file(path: str, chunk_edges: int = 1 << 24) -> CSRGraph:
+    """
+    Load an edge file written by write_graph_chunks as a CSRGraph, reading
+    chunk_edges edges at a time.
+    """
+    import numpy as np
+
+    with open(path, 'rb') as file:
+        magic, n = _EDGE_FILE_HEADER.unpack(file.read(_EDGE_FILE_HEADER.size))
+        if magic != EDGE_FILE_MAGIC:
+            raise ValueError(f'{path} is not an edge file')
+
+        degrees = np.zeros(n, dtype=np.int64)
+        targets = array(NODE_TYPECODE)
+        while True:
+            pairs = np.fromfile(file, dtype='<i4', count=2 * chunk_edges).reshape(-1, 2)
+            if not len(pairs):
+                break
+            degrees += np.bincount(pairs[:, 0], minlength=n)
+            targets.frombytes(pairs[:, 1].astype(np.int32).tobytes())
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+    return CSRGraph(_node_labels(n), array(OFFSET_TYPECODE, offsets.tobytes()), targets)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Stream a large random graph to an edge file')
+    parser.add_argument('path', help='edge file to write')
+    parser.add_argument('n', type=int, help='number of nodes')
+    parser.add_argument('density_factor', type=float)
+    parser.add_argument('--seed', type=int, default=225)
+    parser.add_argument('--chunk-size', type=int, default=1_000_000, help='nodes generated per chunk')
+    args = parser.parse_args()
+
+    edges = write_graph_chunks(args.path, args.n, args.density_factor, args.seed, args.chunk_size)
+    print(f'{args.path} written: {args.n} nodes, {edges} edges')
@@ -0,0 +1,176 @@
+from array import array
+from collections import Counter
+
+from scc import GRAPH, CSRGraph, SCCSummary, as_csr, condensation, NODE_TYPECODE, OFFSET_TYPECODE
+
+
+class IncrementalSCC:
+    """
+    Strongly connected components of a graph that only grows.
+
+    Components are kept in a topological order of the condensation (every
+    component edge goes from a lower order number to a higher one). An inserted
+    edge that agrees with the order costs O(1). Otherwise only the components
+    whose order lies between its endpoints are searched and reordered
+    (Pearce and Kelly's dynamic topological sort), and any components the
+    edge closes a cycle through are merged.
+    """
+
+    def __init__(self, graph: GRAPH | CSRGraph, sccs: list[set[str]] | None = None):
+        """
+        Seed the structure from a graph and, optionally, its find_sccs result.
+        """
+        csr = as_csr(graph)
+        summary = None
+        if sccs is not None:
+            summary = _summary_from_sccs(csr, sccs)
+        dag = condensation(csr, summary)
+
+        count = len(dag)
+        labels = csr.labels
+        self._component_of: dict[str, int] = {
+            labels[u]: c for u, c in enumerate(dag.component_of)
+        }
+        self._members: dict[int, set[str]] = {c: set() for c in range(count)}
+        for label, c in self._component_of.items():
+            self._members[c].add(label)
+
+        self._successors: dict[int, set[int]] = {c: set(dag.successors(c)) for c in range(count)}
+        self._predecessors: dict[int, set[int]] = {c: set() for c in range(count)}
+        for c, successors in self._successors.items():
+            for d in successors:
+                self._predecessors[d].add(c)
+
+        # Sink-to-source ids become a source-to-sink order
+        self._order: dict[int, int] = {c: count - 1 - c for c in range(count)}
+        self._next_id = count
+        self._next_order = count
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._component_of
+
+    def component_of(self, node: str) -> int:
+        """Return the id of the component that contains node"""
+        return self._component_of[node]
+
+    def members(self, component: int) -> set[str]:
+        return self._members[component]
+
+    def same_component(self, a: str, b: str) -> bool:
+        return self._component_of[a] == self._component_of[b]
+
+    def sccs(self) -> list[set[str]]:
+        """Return the current components in sink-to-source order"""
+        order = self._order
+        return [
+            self._members[c]
+            for c in sorted(self._members, key=order.__getitem__, reverse=True)
+        ]
+
+    def add_node(self, node: str) -> int:
+        """Add node as its own component if it is new; return its component id"""
+        component = self._component_of.get(node)
+        if component is not None:
+            return component
+
+        component = self._next_id
+        self._next_id += 1
+        self._component_of[node] = component
+        self._members[component] = {node}
+        self._successors[component] = set()
+        self._predecessors[component] = set()
+        self._order[component] = self._next_order
+        self._next_order += 1
+        return component
+
+    def add_edge(self, source: str, target: str) -> bool:
+        """
+        Insert the edge source -> target, adding either node if it is new.
+        Return True if the edge merged two or more components.
+        """
+        x = self.add_node(source)
+        y = self.add_node(target)
+        if x == y or y in self._successors[x]:
+            return False
+
+        self._successors[x].add(y)
+        self._predecessors[y].add(x)
+
+        order = self._order
+        lower, upper = order[y], order[x]
+        if upper < lower:
+            return False
+
+        # Components between y and x in the order that y reaches, and that reach x
+        forward = self._search(y, self._successors, lambda c: order[c] <= upper)
+        backward = self._search(x, self._predecessors, lambda c: order[c] >= lower)
+
+        # Every slot in the affected region is reused; stay sorted within each side
+        slots = sorted(order[c] for c in forward | backward)
+        cycle = forward & backward
+        before = sorted(backward - cycle, key=order.__getitem__)
+        after = sorted(forward - cycle, key=order.__getitem__)
+
+        for c, slot in zip(before, slots):
+            order[c] = slot
+        for c, slot in zip(after, slots[len(slots) - len(after):]):
+            order[c] = slot
+
+        if not cycle:
+            return False
+
+        merged = self._merge(cycle)
+        order[merged] = slots[len(before)]
+        return True
+
+    @staticmethod
+    def _search(start: int, edges: dict[int, set[int]], in_region) -> set[int]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            for d in edges[stack.pop()]:
+                if d not in seen and in_region(d):
+                    seen.add(d)
+                    stack.append(d)
+        return seen
+
+    def _merge(self, components: set[int]) -> int:
+        """Fold components into the largest of them and return its id"""
+        keep = max(components, key=lambda c: len(self._members[c]))
+        members = self._members[keep]
+        successors = self._successors[keep]
+        predecessors = self._predecessors[keep]
+
+        for c in components:
+            if c == keep:
+                continue
+            for node in self._members.pop(c):
+                self._component_of[node] = keep
+                members.add(node)
+            for d in self._successors.pop(c) - components:
+                self._predecessors[d].discard(c)
+                self._predecessors[d].add(keep)
+                successors.add(d)
+            for d in self._predecessors.pop(c) - components:
+                self._successors[d].discard(c)
+                self._successors[d].add(keep)
+                predecessors.add(d)
+            del self._order[c]
+
+        # Edges inside the merged component are no longer component edges
+        successors -= components
+        predecessors -= components
+        return keep
+
+
+def _summary_from_sccs(csr: CSRGraph, sccs: list[set[str]]) -> SCCSummary:
+    componentOf = array(NODE_TYPECODE, [0]) * len(csr)
+    sizes = array(OFFSET_TYPECODE, map(len, sccs))
+    for c, scc in enumerate(sccs):
+        for node in scc:
+            componentOf[csr.ids[node]] = c
+
+    return SCCSummary(csr.labels, componentOf, sizes, dict(sorted(Counter(sizes).items())))
@@ -1,10 +1,25 @@
-import matplotlib.pyplot as plt
+import argparse
 
-# Run scc.py to populate the runtimes
-from _runtimes import runtimes
+# Run run_scc_analysis.py to populate the results
+from runtime_data import RESULTS_PATH, load_results
 
 
-def main():
+def main(path: str = RESULTS_PATH, runs: list[str] | None = None, algorithm: str | None = None):
+    """
+    Plot the given runs (default: the latest, optionally of one algorithm) against
+    the theoretical fit; the fit is drawn through the first run's points.
+    """
+    import matplotlib.pyplot as plt
+
+    results = load_results(path)
+    if algorithm is not None:
+        results = results.where(algorithm=algorithm)
+    if not runs:
+        runs = results.runs()[-1:]
+    if not runs:
+        raise SystemExit(f'No results in {path} to plot')
+    runtimes = results.where(timestamp=runs[0]).runtimes()
+
     # Define this
     def theoretical_big_o(v, e):
         return v+e
@@ -21,6 +36,10 @@ def main():
     fig = plt.figure()
     ax = fig.add_subplot(111, projection='3d')
     ax.scatter(vv, ee, times, marker='o')
+    for run in runs[1:]:
+        other = results.where(timestamp=run).runtimes()
+        ax.scatter([v for _, _, v, _, _ in other], [e for _, _, _, e, _ in other],
+                   [t for _, _, _, _, t in other], marker='^')
 
     predicted_runtime = [
         coeff * theoretical_big_o(v, e)
@@ -39,7 +58,7 @@ def main():
     )
 
     # Update title, legend, and axis labels as needed
-    ax.legend(['Observed', 'Theoretical O(v+e)'])
+    ax.legend([f'Observed {run}' for run in runs] + ['Theoretical O(v+e)'])
     ax.set_xlabel('|V|')
     ax.set_ylabel('|E|')
     ax.set_zlabel('Runtime')
@@ -54,4 +73,15 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Plot measured runtimes against the theoretical fit')
+    parser.add_argument(
+        'results', nargs='?', default=RESULTS_PATH,
+        help=f'results file written by run_scc_analysis.py (default: {RESULTS_PATH})'
+    )
+    parser.add_argument('--algorithm', help='only consider runs of this algorithm')
+    parser.add_argument(
+        '--run', action='append', dest='runs',
+        help='timestamp of a run to plot; repeat to compare runs (default: the latest)'
+    )
+    args = parser.parse_args()
+    main(args.results, args.runs, args.algorithm)
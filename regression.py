@@ -0,0 +1,110 @@
+import math
+import statistics
+from collections import defaultdict
+from dataclasses import dataclass
+
+
+def mann_whitney_p(baseline: list[float], fresh: list[float]) -> float:
+    """
+    Return the one-sided p-value of a Mann-Whitney U test that fresh tends to be
+    larger than baseline.
+    Uses the normal approximation with tie and continuity corrections, which is
+    accurate enough from about 8 samples per side.
+    """
+    n1, n2 = len(baseline), len(fresh)
+    pooled = sorted([(x, 0) for x in baseline] + [(x, 1) for x in fresh])
+
+    # Average ranks over ties, and collect the tie sizes for the variance
+    rank_sum_fresh = 0.0
+    tie_term = 0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        rank_sum_fresh += rank * sum(side for _, side in pooled[i:j + 1])
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    n = n1 + n2
+    u = rank_sum_fresh - n2 * (n2 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclass
+class CellComparison:
+    """Per-(V+E) cost of one (density, size) cell in a baseline and a fresh run"""
+    density: float
+    size: int
+    baseline_ns: float  # median nanoseconds per (V+E)
+    fresh_ns: float
+    p_value: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.fresh_ns / self.baseline_ns
+
+
+def _costs_by_cell(runtimes: list[tuple]) -> dict[tuple[float, int], list[float]]:
+    cells = defaultdict(list)
+    for density, size, v, e, seconds in runtimes:
+        cells[float(density), int(size)].append(seconds * 1e9 / (v + e))
+    return cells
+
+
+def compare_runtimes(baseline: list[tuple], fresh: list[tuple], threshold: float = 0.1,
+                     alpha: float = 0.01) -> list[CellComparison]:
+    """
+    Compare the per-(V+E) cost of two sets of (density, size, V, E, seconds) rows
+    cell by cell. A cell regressed when fresh is significantly slower (p < alpha)
+    and its median cost is more than threshold (a fraction) above the baseline's.
+    Cells missing from either side, or with fewer than two samples, are skipped.
+    """
+    baseline_cells, fresh_cells = _costs_by_cell(baseline), _costs_by_cell(fresh)
+    comparisons = []
+    for cell in sorted(baseline_cells.keys() & fresh_cells.keys()):
+        before, after = baseline_cells[cell], fresh_cells[cell]
+        if len(before) < 2 or len(after) < 2:
+            continue
+        baseline_ns, fresh_ns = statistics.median(before), statistics.median(after)
+        p = mann_whitney_p(before, after)
+        comparisons.append(CellComparison(
+            density=cell[0],
+            size=cell[1],
+            baseline_ns=baseline_ns,
+            fresh_ns=fresh_ns,
+            p_value=p,
+            regressed=p < alpha and fresh_ns > baseline_ns * (1 + threshold),
+        ))
+    return comparisons
+
+
+def format_report(comparisons: list[CellComparison], threshold: float, alpha: float) -> str:
+    """Return a markdown table of the comparisons and a one-line verdict"""
+    lines = [
+        '| Density Factor | Size | Baseline (ns/(V+E)) | Fresh (ns/(V+E)) | Ratio | p-value | Status    |',
+        '| -------------- | ---- | ------------------- | ---------------- | ----- | ------- | --------- |',
+    ]
+    for c in comparisons:
+        status = 'REGRESSED' if c.regressed else 'ok'
+        lines.append(
+            f'| {c.density:<14} | {c.size:<4} | {c.baseline_ns:<19.3g} | {c.fresh_ns:<16.3g} '
+            f'| {c.ratio:<5.2f} | {c.p_value:<7.2g} | {status:<9} |'
+        )
+
+    regressed = sum(c.regressed for c in comparisons)
+    lines.append('')
+    if regressed:
+        lines.append(
+            f'{regressed} of {len(comparisons)} cells regressed: more than {threshold:.0%} slower '
+            f'per (V+E) with p < {alpha}'
+        )
+    else:
+        lines.append(f'No regressions in {len(comparisons)} cells (threshold {threshold:.0%}, alpha {alpha})')
+    return '\n'.join(lines)
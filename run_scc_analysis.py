@@ -1,52 +1,183 @@
+import argparse
+import os
 import random
-from pprint import pprint
-from time import time
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Callable
 
-from graphs import generate_graph
+from benchmark import measure, summarize
+from graphs import generate_graph, generate_graph_vectorized, load_edge_file
+from regression import compare_runtimes, format_report
+from runtime_data import PHASES_PATH, RESULTS_PATH, append_phases, append_results, current_run, load_results
 # noinspection PyUnusedImports
-from scc import prepost, find_sccs
+from scc import GRAPH, prepost, find_sccs, record_phases, PhaseStats
+
+# The analyses a sweep can time, by the name recorded in the results store
+ANALYSES = {'find_sccs': find_sccs, 'prepost': prepost}
+SEEDS = [225 + iteration for iteration in range(10)]
+
+
+def _generate(seed: int, n: int, density_factor: float, vectorized: bool = False) -> GRAPH:
+    if vectorized:
+        return generate_graph_vectorized(n, density_factor, seed)
+    random.seed(seed)
+    return generate_graph(n, density_factor)
+
+
+def _generator_name(vectorized: bool) -> str:
+    """The generator recorded in the results store for a sweep"""
+    return (generate_graph_vectorized if vectorized else generate_graph).__name__
+
+
+def time_analysis(
+        graph: GRAPH,
+        analyze: Callable,
+        repeats: int = 1,
+        warmup: int = 0,
+        phases: bool = False
+) -> tuple[int, int, float] | tuple[int, int, float, list[PhaseStats]]:
+    """
+    Return the graph's V, E and the time in seconds to analyze it.
+    With repeats > 1 the time is the fastest of that many runs (see benchmark.measure).
+    With phases, also return the per-phase stats of analyze (see scc.record_phases).
+    Each phase time is the fastest of another `repeats` instrumented runs, and the
+    peaks come from one more run under tracemalloc, so neither slows the timed runs.
+    """
+    V = len(graph)
+    E = sum(len(edges) for edges in graph.values())
+
+    samples = measure(analyze, graph, repeats, warmup)
+
+    duration = min(samples) / 1e9
+
+    if not phases:
+        return V, E, duration
+
+    fastest: dict[str, PhaseStats] = {}
+    for _ in range(repeats):
+        with record_phases() as timed:
+            analyze(graph)
+        for name, phase in timed.totals().items():
+            if name not in fastest or phase.seconds < fastest[name].seconds:
+                fastest[name] = phase
+    with record_phases(memory=True) as traced:
+        analyze(graph)
+    peaks = traced.totals()
+    stats = [
+        PhaseStats(name, phase.seconds, phase.nodes, phase.edges, peaks[name].peak_bytes)
+        for name, phase in fastest.items()
+    ]
+    return V, E, duration, stats
 
 
 def generate_and_analyze_graph(
         seed: int,
         n: int,
         density_factor: float,
-        analyze: Callable
-) -> tuple[int, int, float]:
-    random.seed(seed)
-    graph = generate_graph(n, density_factor)
+        analyze: Callable,
+        repeats: int = 1,
+        warmup: int = 0,
+        vectorized: bool = False,
+        phases: bool = False
+) -> tuple[int, int, float] | tuple[int, int, float, list[PhaseStats]]:
+    """
+    Generate a graph and return its V, E and the time in seconds to analyze it
+    (see time_analysis).
+    With vectorized, the graph comes from generate_graph_vectorized instead.
+    """
+    graph = _generate(seed, n, density_factor, vectorized)
+    return time_analysis(graph, analyze, repeats, warmup, phases)
+
+
+def _generate_job(job: tuple[int, int, float, bool]) -> GRAPH:
+    return _generate(*job)
 
-    V = len(graph)
-    E = sum(len(edges) for edges in graph.values())
 
-    start = time()
+def run_sweep(densities, sizes, seeds, analyze: Callable, workers: int = 1,
+              repeats: int = 1, warmup: int = 0, vectorized: bool = False, phases: bool = False):
+    """
+    Run generate_and_analyze_graph for every (density, size, seed) combination
+    and return (density, size, V, E, runtime) rows in that nested order.
+    With phases, each row ends with the graph's list of PhaseStats as well.
 
-    analyze(graph)
+    With more than one worker, a process pool generates the graphs of each
+    (density, size) cell in parallel, and then this process times them one at a
+    time while the pool is idle. The timings never share the machine with one
+    another or with generation, so they do not depend on the worker count.
+    """
+    cells = [(density_factor, size) for density_factor in densities for size in sizes]
 
-    duration = time() - start
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    if pool:
+        print(f'Generating graphs on {workers} workers, timing them one at a time')
+    runtimes = []
+    try:
+        for density_factor, size in cells:
+            if size == sizes[0]:
+                print('Running with density factor', density_factor)
+            print('Running with size', size)
 
-    return V, E, duration
+            jobs = [(seed, size, density_factor, vectorized) for seed in seeds]
+            if pool:
+                graphs = list(pool.map(_generate_job, jobs))
+            else:
+                graphs = map(_generate_job, jobs)
 
+            for graph in graphs:
+                runtimes.append((density_factor, size, *time_analysis(graph, analyze, repeats, warmup, phases)))
+    finally:
+        if pool:
+            pool.shutdown()
+    return runtimes
 
-def _compute_average_runtimes(runtimes):
+
+def _compute_runtime_stats(runtimes):
+    """
+    Return (density, size, mean V, mean E, min, median, IQR) for each (density, size),
+    where the runtime statistics are taken over that cell's seeds.
+    """
     groups = {}
     for dens, size, v, e, runtime in runtimes:
-        key = (dens, size)
-        if key not in groups:
-            groups[key] = []
-        groups[key].append((v, e, runtime))
+        groups.setdefault((dens, size), []).append((v, e, runtime))
 
-    return [
-        (
+    rows = []
+    for (dens, size), stats in groups.items():
+        fastest, median, iqr = summarize([t for _, _, t in stats])
+        rows.append((
             dens,
             size,
             round(sum(v for v, _, _ in stats) / len(stats), 3),
             round(sum(e for _, e, _ in stats) / len(stats), 3),
-            round(sum(t for _, _, t in stats) / len(stats), 3)
-        )
-        for (dens, size), stats in groups.items()
-    ]
+            float(f'{fastest:.3g}'),
+            float(f'{median:.3g}'),
+            float(f'{iqr:.3g}')
+        ))
+    return rows
+
+
+def _compute_phase_stats(rows):
+    """
+    Return the phase names and, for each (density, size), a row of
+    (density, size, median seconds of each phase..., dominant phase, max peak KiB),
+    with the medians taken over that cell's seeds.
+    """
+    groups = {}
+    for dens, size, _, _, _, stats in rows:
+        groups.setdefault((dens, size), []).append({phase.name: phase for phase in stats})
+
+    names = list(next(iter(groups.values()))[0]) if groups else []
+    table = []
+    for (dens, size), graphs in groups.items():
+        medians = [summarize([graph[name].seconds for graph in graphs])[1] for name in names]
+        peak = max(max(phase.peak_bytes for phase in graph.values()) for graph in graphs)
+        table.append((
+            dens,
+            size,
+            *(float(f'{median:.3g}') for median in medians),
+            names[medians.index(max(medians))],
+            round(peak / 1024, 1)
+        ))
+    return names, table
 
 
 def _print_markdown_table(ave_runtimes, headers):
@@ -70,44 +201,190 @@ def _print_markdown_table(ave_runtimes, headers):
     print('\n'.join(rows))
 
 
-def main():
+def analyze_edge_file(path: str, analyze: Callable, repeats: int = 1, warmup: int = 0):
+    """
+    Load a graph written by graphs.write_graph_chunks and print V, E and the
+    min/median/IQR time to analyze it.
+    """
+    graph = load_edge_file(path)
+    print(f'{path}: V = {len(graph)}, E = {graph.num_edges}')
+
+    fastest, median, iqr = summarize([t / 1e9 for t in measure(analyze, graph, repeats, warmup)])
+    print(f'{analyze.__name__}: min {fastest:.3g} s, median {median:.3g} s, IQR {iqr:.3g} s')
+
+
+def check_regression(algorithm: str = 'find_sccs', baseline_run: str | None = None,
+                     threshold: float = 0.1, alpha: float = 0.01, path: str = RESULTS_PATH,
+                     workers: int = 1, repeats: int | None = None, warmup: int | None = None,
+                     vectorized: bool | None = None) -> bool:
+    """
+    Sweep the (density, size) cells of a stored baseline run of algorithm again and
+    print how the per-(V+E) cost of each cell compares (see regression.py).
+    The fresh sweep uses the baseline's generator, repeats and warmup, so both sides
+    time the same graphs the same way; passing a different one is an error.
+    The baseline defaults to the latest stored run of algorithm. Return True if no
+    cell regressed. The fresh sweep is not added to the results store.
+    """
+    results = load_results(path).where(algorithm=algorithm)
+    baseline = results.where(timestamp=baseline_run) if baseline_run else results.latest()
+    if len(baseline) == 0:
+        raise SystemExit(f'No {algorithm} baseline run {baseline_run or ""} in {path}')
+
+    run = baseline.run_info()
+    if run.generator not in (_generator_name(False), _generator_name(True)):
+        raise SystemExit(f'Baseline run {run.timestamp} used an unknown generator {run.generator!r}')
+    requested = (
+        run.generator if vectorized is None else _generator_name(vectorized),
+        run.repeats if repeats is None else repeats,
+        run.warmup if warmup is None else warmup,
+    )
+    if requested != run.settings():
+        raise SystemExit(
+            f'Baseline run {run.timestamp} was measured with (generator, repeats, warmup) = '
+            f'{run.settings()}, not {requested}; the runs are not comparable'
+        )
+
+    rows = baseline.runtimes()
+    print(f'Baseline: run {run.timestamp} at revision {run.revision} '
+          f'({run.generator}, repeats {run.repeats}, warmup {run.warmup})')
+    fresh = run_sweep(
+        sorted({density for density, *_ in rows}),
+        sorted({size for _, size, *_ in rows}),
+        SEEDS,
+        ANALYSES[algorithm],
+        workers=workers,
+        repeats=run.repeats,
+        warmup=run.warmup,
+        vectorized=run.generator == _generator_name(True)
+    )
+
+    comparisons = compare_runtimes(rows, fresh, threshold, alpha)
+    print()
+    print(format_report(comparisons, threshold, alpha))
+    return not any(comparison.regressed for comparison in comparisons)
+
+
+def main(workers: int = 1, repeats: int = 5, warmup: int = 1, vectorized: bool = False,
+         algorithm: str = 'find_sccs', phases: bool = False):
     densities = [0.25, 0.5, 1, 2, 3]
     sizes = [10, 50, 100, 500, 1000, 2000, 4000, 8000]
 
-    runtimes = []
-    for density_factor in densities:
-        print('Running with density factor', density_factor)
-        for size in sizes:
-            print('Running with size', size)
-            for iteration in range(10):
-                v, e, runtime = generate_and_analyze_graph(
-                    225 + iteration,
-                    size,
-                    density_factor,
-                    # Pass in either prepost
-                    # prepost,
-                    # or find_sccs
-                    find_sccs
-                    # for the analysis you want to run on the graph
-                )
-                runtimes.append((density_factor, size, v, e, runtime))
-
-    ave_runtimes = _compute_average_runtimes(runtimes)
+    # algorithm is either prepost or find_sccs, the analysis you want to run on the graph
+    run = current_run(algorithm, _generator_name(vectorized), repeats, warmup)
+
+    runtimes = run_sweep(
+        densities,
+        sizes,
+        SEEDS,
+        ANALYSES[algorithm],
+        workers=workers,
+        repeats=repeats,
+        warmup=warmup,
+        vectorized=vectorized,
+        phases=phases
+    )
+    phase_rows = runtimes if phases else []
+    runtimes = [row[:5] for row in runtimes]
+
+    runtime_stats = _compute_runtime_stats(runtimes)
 
     print()
     _print_markdown_table(
-        ave_runtimes,
-        ['Density Factor', 'Size ', '   V   ', '   E   ', 'Time (sec)']
+        runtime_stats,
+        ['Density Factor', 'Size ', '   V   ', '   E   ', 'Min (sec)', 'Median (sec)', 'IQR (sec)']
     )
 
-    # Print runtimes to a file
-    with open('_runtimes.py', 'w') as file:
-        print('runtimes = ', end='', file=file)
-        pprint(runtimes, file)
+    if phases:
+        names, phase_stats = _compute_phase_stats(phase_rows)
+        print()
+        _print_markdown_table(
+            phase_stats,
+            ['Density Factor', 'Size ']
+            + [f'{name} (sec)' for name in names]
+            + ['Dominant phase', 'Peak (KiB)']
+        )
+
+    # Append this run for compute_coefficient.py and the plotting script
+    append_results(runtimes, run)
+    if phases:
+        append_phases([
+            (dens, size, v, e, phase.name, phase.seconds, phase.nodes, phase.edges, phase.peak_bytes)
+            for dens, size, v, e, _, stats in phase_rows
+            for phase in stats
+        ], run)
 
     print()
-    print('_runtimes.py written')
+    print(f'Run {run.timestamp} appended to {RESULTS_PATH}')
+    if phases:
+        print(f'Its phase timings were appended to {PHASES_PATH}')
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {value}')
+    return value
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Time SCC analysis over a sweep of random graphs')
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help='worker processes that generate graphs; timing always runs serially here '
+             '(0 = one per CPU, default: 1 = generate in this process)'
+    )
+    parser.add_argument(
+        '--repeats', type=_positive_int,
+        help='timed runs per graph; the fastest is recorded (default: 5; with --check-regression, the baseline\'s)'
+    )
+    parser.add_argument(
+        '--warmup', type=int,
+        help='untimed runs per graph before timing (default: 1; with --check-regression, the baseline\'s)'
+    )
+    parser.add_argument(
+        '--vectorized', action='store_true',
+        help='generate graphs with the NumPy generator (same distribution, different graphs)'
+    )
+    parser.add_argument(
+        '--algorithm', choices=ANALYSES, default='find_sccs',
+        help='analysis to time (default: find_sccs)'
+    )
+    parser.add_argument(
+        '--phases', action='store_true',
+        help=f'also record per-phase time, work and peak allocation of each graph in {PHASES_PATH}'
+    )
+    parser.add_argument(
+        '--edge-file',
+        help='time the analysis on this edge file (see graphs.py) instead of running the sweep'
+    )
+    parser.add_argument(
+        '--check-regression', action='store_true',
+        help='re-run a stored baseline sweep with its generator, repeats and warmup, and exit '
+             'with status 1 if any cell got slower per (V+E)'
+    )
+    parser.add_argument(
+        '--baseline', metavar='RUN',
+        help='timestamp of the baseline run to check against (default: the latest of the algorithm)'
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='slowdown in median cost per (V+E) that counts as a regression (default: 0.1 = 10%%)'
+    )
+    parser.add_argument(
+        '--alpha', type=float, default=0.01,
+        help='significance level of the one-sided Mann-Whitney U test (default: 0.01)'
+    )
+    args = parser.parse_args()
+    workers = args.workers or os.cpu_count()
+    repeats = 5 if args.repeats is None else args.repeats
+    warmup = 1 if args.warmup is None else args.warmup
+    if args.edge_file:
+        analyze_edge_file(args.edge_file, ANALYSES[args.algorithm], repeats, warmup)
+    elif args.check_regression:
+        passed = check_regression(
+            args.algorithm, args.baseline, args.threshold, args.alpha, workers=workers,
+            repeats=args.repeats, warmup=args.warmup, vectorized=args.vectorized or None
+        )
+        sys.exit(0 if passed else 1)
+    else:
+        main(workers, repeats, warmup, args.vectorized, args.algorithm, args.phases)
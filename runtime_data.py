@@ -0,0 +1,171 @@
+import csv
+import os
+from dataclasses import astuple, dataclass
+
+# Benchmark results as an append-only CSV, one row per timed graph. Each sweep
+# appends its rows under a new timestamp, which identifies the run, along with
+# the settings it was measured with:
+#   timestamp, algorithm, revision, machine, generator, repeats, warmup,
+#   density, size, V, E, seconds
+RESULTS_PATH = '_results.csv'
+RUN_COLUMNS = ('timestamp', 'algorithm', 'revision', 'machine', 'generator', 'repeats', 'warmup')
+_RUN_TYPES = (str, str, str, str, str, int, int)
+COLUMNS = RUN_COLUMNS + ('density', 'size', 'V', 'E', 'seconds')
+_TYPES = _RUN_TYPES + (float, int, int, int, float)
+
+# Per-phase measurements of instrumented runs (see scc.record_phases), one row per
+# graph and phase, alongside the results of the same run
+PHASES_PATH = '_phases.csv'
+PHASE_COLUMNS = COLUMNS[:-1] + ('phase', 'seconds', 'nodes', 'edges', 'peak_bytes')
+_PHASE_TYPES = _TYPES[:-1] + (str, float, int, int, int)
+
+
+@dataclass
+class RunInfo:
+    """What every row of one benchmark run records besides its measurement"""
+    timestamp: str
+    algorithm: str
+    revision: str
+    machine: str
+    generator: str = 'generate_graph'  # the graphs.py function that made the graphs
+    repeats: int = 1  # timed runs per graph; the fastest is recorded
+    warmup: int = 0  # untimed runs per graph before those
+
+    def settings(self) -> tuple[str, int, int]:
+        """The (generator, repeats, warmup) a comparable run has to share"""
+        return self.generator, self.repeats, self.warmup
+
+
+def current_run(algorithm: str, generator: str = 'generate_graph', repeats: int = 1,
+                warmup: int = 0) -> RunInfo:
+    """
+    Describe a run of algorithm with these settings starting now: UTC time, the git
+    revision of this checkout ('unknown' outside git) and the machine and Python it
+    runs on.
+    """
+    import platform
+    import subprocess
+    from datetime import datetime, timezone
+
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = 'unknown'
+
+    return RunInfo(
+        timestamp=datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        algorithm=algorithm,
+        revision=revision,
+        machine=f'{platform.node()} {platform.machine()} '
+                f'{platform.python_implementation()} {platform.python_version()}',
+        generator=generator,
+        repeats=repeats,
+        warmup=warmup,
+    )
+
+
+def _check_header(path: str, names: tuple[str, ...]) -> None:
+    with open(path, newline='') as file:
+        header = next(csv.reader(file), None)
+    if tuple(header or ()) != names:
+        raise ValueError(f'{path} does not have the columns {names}')
+
+
+def _append_rows(path: str, columns: tuple[str, ...], run: RunInfo, rows) -> None:
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    if not new_file:
+        _check_header(path, columns)
+    with open(path, 'a', newline='') as file:
+        writer = csv.writer(file)
+        if new_file:
+            writer.writerow(columns)
+        prefix = astuple(run)
+        writer.writerows(prefix + tuple(row) for row in rows)
+
+
+def append_results(runtimes: list[tuple], run: RunInfo, path: str = RESULTS_PATH) -> None:
+    """
+    Append the (density, size, V, E, seconds) rows from run_sweep to path as one run.
+    """
+    _append_rows(path, COLUMNS, run, runtimes)
+
+
+def append_phases(phase_rows: list[tuple], run: RunInfo, path: str = PHASES_PATH) -> None:
+    """
+    Append (density, size, V, E, phase, seconds, nodes, edges, peak_bytes) rows to path
+    as part of run.
+    """
+    _append_rows(path, PHASE_COLUMNS, run, phase_rows)
+
+
+class ResultTable:
+    """
+    Benchmark rows held column by column, as loaded by load_results.
+    """
+
+    def __init__(self, columns: dict[str, list]):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns['timestamp'])
+
+    def __getitem__(self, name: str) -> list:
+        return self.columns[name]
+
+    def where(self, **equals) -> 'ResultTable':
+        """Return the rows whose columns equal the given values, e.g. where(algorithm='find_sccs')"""
+        keep = range(len(self))
+        for name, value in equals.items():
+            column = self.columns[name]
+            keep = [i for i in keep if column[i] == value]
+        return ResultTable({name: [column[i] for i in keep] for name, column in self.columns.items()})
+
+    def runs(self) -> list[str]:
+        """Return the run timestamps, oldest first"""
+        return sorted(set(self.columns['timestamp']))
+
+    def run_info(self) -> RunInfo:
+        """Return the RunInfo of the first row, which describes its whole run"""
+        return RunInfo(*(self.columns[name][0] for name in RUN_COLUMNS))
+
+    def latest(self) -> 'ResultTable':
+        """Return the rows of the most recent run"""
+        runs = self.runs()
+        return self.where(timestamp=runs[-1]) if runs else self
+
+    def runtimes(self) -> list[tuple[float, int, int, int, float]]:
+        """Return the rows as the (density, size, V, E, seconds) tuples of run_sweep"""
+        columns = self.columns
+        return list(zip(columns['density'], columns['size'], columns['V'], columns['E'], columns['seconds']))
+
+
+def _load_table(path: str, names: tuple[str, ...], types: tuple) -> ResultTable:
+    with open(path, newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader)
+        if tuple(header) != names:
+            raise ValueError(f'{path} does not have the columns {names}')
+        rows = list(reader)
+
+    columns = {}
+    for i, (name, kind) in enumerate(zip(names, types)):
+        columns[name] = [kind(row[i]) for row in rows]
+    return ResultTable(columns)
+
+
+def load_results(path: str = RESULTS_PATH) -> ResultTable:
+    """
+    Read every run appended to path.
+    """
+    return _load_table(path, COLUMNS, _TYPES)
+
+
+def load_phases(path: str = PHASES_PATH) -> ResultTable:
+    """
+    Read every phase row appended to path; where(phase=...) selects one phase.
+    """
+    return _load_table(path, PHASE_COLUMNS, _PHASE_TYPES)
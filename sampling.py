@@ -0,0 +1,172 @@
+import random
+from collections import deque
+
+from scc import GRAPH, CSRGraph, as_csr
+
+
+def bfs_sample(csr: CSRGraph, max_size: int, seeds=None, keys: int | None = None) -> list[int]:
+    """
+    Return up to max_size node ids in breadth-first order from seeds (default: the
+    first three nodes).
+    Nodes are deduplicated when they are queued, so each is queued at most once.
+    Only ids below keys count toward the sample; higher ids are the neighbor-only
+    nodes of a converted GRAPH, which are not part of it.
+    """
+    offsets, targets = csr.offsets, csr.targets
+    if keys is None:
+        keys = len(csr)
+    if seeds is None:
+        seeds = range(min(3, len(csr)))
+
+    queued = bytearray(len(csr))
+    queue = deque()
+    for u in seeds:
+        if not queued[u]:
+            queued[u] = 1
+            queue.append(u)
+
+    sample: list[int] = []
+    while queue and len(sample) < max_size:
+        u = queue.popleft()
+        if u >= keys:
+            continue
+        sample.append(u)
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if not queued[v]:
+                queued[v] = 1
+                queue.append(v)
+
+    return sample
+
+
+def random_walk_sample(csr: CSRGraph, max_size: int, seed: int | None = None,
+                       restart_probability: float = 0.15, stall_limit: int = 100) -> list[int]:
+    """
+    Return up to max_size node ids visited by a random walk with restarts.
+    At each step the walk returns to its start with restart_probability, or when it
+    reaches a node without out-edges. After stall_limit steps without finding a new
+    node it starts over from a random unvisited node.
+    """
+    rng = random.Random(seed)
+    offsets, targets = csr.offsets, csr.targets
+    n = len(csr)
+    max_size = min(max_size, n)
+
+    visited = bytearray(n)
+    sample: list[int] = []
+
+    def new_start() -> int:
+        u = rng.randrange(n)
+        while visited[u]:
+            u = rng.randrange(n)
+        visited[u] = 1
+        sample.append(u)
+        return u
+
+    start = u = new_start() if max_size else 0
+    stalled = 0
+    while len(sample) < max_size:
+        begin, end = offsets[u], offsets[u + 1]
+        if begin == end or rng.random() < restart_probability:
+            u = start
+        else:
+            u = targets[rng.randrange(begin, end)]
+
+        if visited[u]:
+            stalled += 1
+            if stalled >= stall_limit:
+                start = u = new_start()
+                stalled = 0
+        else:
+            visited[u] = 1
+            sample.append(u)
+            stalled = 0
+
+    return sample
+
+
+def forest_fire_sample(csr: CSRGraph, max_size: int, seed: int | None = None,
+                       burn_probability: float = 0.7) -> list[int]:
+    """
+    Return up to max_size node ids burned by forest-fire sampling.
+    Each burning node sets fire to a geometrically distributed number (mean
+    p / (1 - p)) of its unburned out-neighbors; when the fire dies out, a new one
+    starts at a random unburned node.
+    """
+    rng = random.Random(seed)
+    offsets, targets = csr.offsets, csr.targets
+    n = len(csr)
+    max_size = min(max_size, n)
+
+    burned = bytearray(n)
+    sample: list[int] = []
+    front = deque()
+    while len(sample) < max_size:
+        if not front:
+            u = rng.randrange(n)
+            while burned[u]:
+                u = rng.randrange(n)
+            burned[u] = 1
+            sample.append(u)
+            front.append(u)
+            continue
+
+        u = front.popleft()
+        spread = 0
+        while rng.random() < burn_probability:
+            spread += 1
+
+        unburned = [v for v in dict.fromkeys(targets[offsets[u]:offsets[u + 1]]) if not burned[v]]
+        for v in rng.sample(unburned, min(spread, len(unburned))):
+            if len(sample) >= max_size:
+                break
+            burned[v] = 1
+            sample.append(v)
+            front.append(v)
+
+    return sample
+
+
+SAMPLERS = {
+    'bfs': bfs_sample,
+    'random_walk': random_walk_sample,
+    'forest_fire': forest_fire_sample,
+}
+
+
+def subgraph(csr: CSRGraph, nodes: list[int], induced: bool = False) -> GRAPH:
+    """
+    Return the GRAPH of the given node ids, in that order.
+    Each node keeps its full neighbor list, or with induced only the neighbors
+    that are in nodes.
+    """
+    labels, offsets, targets = csr.labels, csr.offsets, csr.targets
+    if not induced:
+        return {
+            labels[u]: [labels[v] for v in targets[offsets[u]:offsets[u + 1]]]
+            for u in nodes
+        }
+
+    inside = bytearray(len(csr))
+    for u in nodes:
+        inside[u] = 1
+    return {
+        labels[u]: [labels[v] for v in targets[offsets[u]:offsets[u + 1]] if inside[v]]
+        for u in nodes
+    }
+
+
+def sample_subgraph(graph: GRAPH | CSRGraph, max_size: int, strategy: str = 'bfs',
+                    induced: bool = False, **options) -> GRAPH:
+    """
+    Sample up to max_size nodes of graph with the named strategy ('bfs',
+    'random_walk' or 'forest_fire') and return their subgraph.
+    Extra keyword options go to the sampler.
+    """
+    if strategy not in SAMPLERS:
+        raise ValueError(f"Unknown sampling strategy {strategy!r}, expected one of {list(SAMPLERS)}")
+
+    csr = as_csr(graph)
+    if strategy == 'bfs' and not isinstance(graph, CSRGraph):
+        options.setdefault('keys', len(graph))
+    return subgraph(csr, SAMPLERS[strategy](csr, max_size, **options), induced)
@@ -1,6 +1,13 @@
 import random
-import sys
-from time import time
+import tracemalloc
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
+from heapq import heappush, heapreplace
+from itertools import accumulate
+from time import perf_counter_ns, time
 # import kagglehub
 
 # Download latest version
@@ -9,148 +16,1299 @@ from time import time
 # print("Path to dataset files:", path)
 
 GRAPH = dict[str, list[str]]
-sys.setrecursionlimit(10000)
 
+# Typecodes for the flat CSR arrays: 64-bit edge offsets, 32-bit node ids
+OFFSET_TYPECODE = 'q'
+NODE_TYPECODE = 'i'
 
-def prepost(graph: GRAPH) -> list[dict[str, list[int]]]:
+
+class CSRGraph:
+    """
+    A directed graph in compressed-sparse-row form.
+    Node ids are 0..n-1 in the order of `labels`, and the out-neighbors of node u are
+    targets[offsets[u]:offsets[u + 1]].
+    """
+
+    __slots__ = ('labels', '_ids', 'offsets', 'targets', '_repeats')
+
+    def __init__(self, labels: list[str], offsets, targets, ids: dict[str, int] | None = None,
+                 repeats: bool | None = None):
+        self.labels = labels
+        self._ids = ids
+        self.offsets = offsets
+        self.targets = targets
+        self._repeats = repeats
+
+    @property
+    def ids(self) -> dict[str, int]:
+        """Map from label to node id, built on first use"""
+        if self._ids is None:
+            self._ids = {label: i for i, label in enumerate(self.labels)}
+        return self._ids
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def neighbors(self, u: int):
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def rows(self):
+        """Yield the out-neighbors of each node in id order"""
+        offsets, targets = self.offsets, self.targets
+        for u in range(len(self.labels)):
+            yield targets[offsets[u]:offsets[u + 1]]
+
+    @property
+    def has_repeated_edges(self) -> bool:
+        """Whether some node lists a neighbor more than once, found on first use"""
+        if self._repeats is None:
+            self._repeats = any(len(row) > 1 and len(set(row)) < len(row) for row in self.rows())
+        return self._repeats
+
+    @classmethod
+    def from_graph(cls, graph: GRAPH) -> 'CSRGraph':
+        """
+        Convert a GRAPH to CSR form.
+        Keys keep their dictionary order; neighbors that are not keys are appended after
+        them, in the order they are first seen, as nodes without out-edges.
+        """
+        labels = list(graph)
+        ids = {label: i for i, label in enumerate(labels)}
+        offsets = array(OFFSET_TYPECODE, [0])
+        targets = array(NODE_TYPECODE)
+
+        lookup = ids.__getitem__
+        for node in graph:
+            neighbors = graph[node]
+            start = len(targets)
+            try:
+                targets.extend(map(lookup, neighbors))
+            except KeyError:
+                # Some neighbor is not a key yet: redo this row one edge at a time
+                del targets[start:]
+                for neighbor in neighbors:
+                    v = ids.get(neighbor)
+                    if v is None:
+                        v = ids[neighbor] = len(labels)
+                        labels.append(neighbor)
+                    targets.append(v)
+            offsets.append(len(targets))
+
+        offsets.extend([len(targets)] * (len(labels) - len(graph)))
+
+        return cls(labels, offsets, targets, ids)
+
+    def to_graph(self) -> GRAPH:
+        labels, offsets, targets = self.labels, self.offsets, self.targets
+        return {
+            labels[u]: [labels[v] for v in targets[offsets[u]:offsets[u + 1]]]
+            for u in range(len(labels))
+        }
+
+    def reverse(self) -> 'CSRGraph':
+        """
+        Return the graph with every edge reversed, using the same node ids.
+        Each reversed adjacency list keeps the order in which its sources appear here.
+        """
+        n = len(self.labels)
+        offsets, targets = self.offsets, self.targets
+
+        # 1. count the in-degrees; prefix sums give the reversed offsets
+        inDegree = array(OFFSET_TYPECODE, [0]) * (n + 1)
+        for v in targets:
+            inDegree[v + 1] += 1
+        reverseOffsets = array(OFFSET_TYPECODE, accumulate(inDegree))
+        del inDegree
+
+        # 2. place each edge at its target's cursor, visiting sources in id order
+        cursor = reverseOffsets[:n]
+        reverseTargets = array(NODE_TYPECODE, [0]) * len(targets)
+        for u in range(n):
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                reverseTargets[cursor[v]] = u
+                cursor[v] += 1
+
+        return CSRGraph(self.labels, reverseOffsets, reverseTargets, self._ids, self._repeats)
+
+
+def as_csr(graph: GRAPH | CSRGraph) -> CSRGraph:
+    """Return graph in CSR form, converting a GRAPH if necessary"""
+    if isinstance(graph, CSRGraph):
+        return graph
+    return CSRGraph.from_graph(graph)
+
+
+def _dfs(csr: CSRGraph, roots, pre: array, post: array) -> tuple[list[int], list[int], list[int]]:
+    """
+    Run an iterative DFS over csr, starting a new tree from each unvisited root in turn.
+    Fills in pre and post, which must start out as all zeros.
+    Return the node ids in discovery order, the index in that list where each tree
+    starts, and the node ids in the order they finished (ascending post number).
+    """
+    offsets, targets = csr.offsets, csr.targets
+    visited = bytearray(len(pre))
+    discovered: list[int] = []
+    treeStarts: list[int] = []
+    finished: list[int] = []
+    discover, finish = discovered.append, finished.append
+    clock = 1
+
+    for root in roots:
+        if visited[root]:
+            continue
+
+        treeStarts.append(len(discovered))
+        discover(root)
+        visited[root] = 1
+        pre[root] = clock
+        clock += 1
+
+        # The current frame lives in locals; suspended frames hold the
+        # node id and the iterator over its remaining neighbors
+        u = root
+        neighbors = iter(targets[offsets[u]:offsets[u + 1]])
+        stack = []
+        push, pop = stack.append, stack.pop
+        while True:
+            for v in neighbors:
+                if not visited[v]:
+                    visited[v] = 1
+                    push((u, neighbors))
+                    discover(v)
+                    pre[v] = clock
+                    clock += 1
+                    u = v
+                    neighbors = iter(targets[offsets[v]:offsets[v + 1]])
+                    break
+            else:
+                post[u] = clock
+                clock += 1
+                finish(u)
+                if not stack:
+                    break
+                u, neighbors = pop()
+
+    return discovered, treeStarts, finished
+
+
+def _new_numbering(n: int) -> array:
+    return array(OFFSET_TYPECODE, [0]) * n
+
+
+def _forest_labels(csr: CSRGraph, discovered: list[int], treeStarts: list[int],
+                   pre: array, post: array) -> list[dict[str, list[int]]]:
+    labels = csr.labels
+    bounds = treeStarts[1:] + [len(discovered)]
+    return [
+        {labels[u]: [pre[u], post[u]] for u in discovered[start:end]}
+        for start, end in zip(treeStarts, bounds)
+    ]
+
+
+def prepost(graph: GRAPH | CSRGraph) -> list[dict[str, list[int]]]:
     """
     Return a list of DFS trees.
     Each tree is a dict mapping each node label to a list of [pre, post] order numbers.
     The graph should be searched in order of the keys in the dictionary.
+
+    The search uses an explicit stack of neighbor iterators instead of recursion,
+    so arbitrarily deep paths do not depend on the interpreter recursion limit.
+    A GRAPH is searched as it is; converting it to CSR first would cost more than
+    the search saves.
     """
+    recorder = _recorder
+    if recorder:
+        mark = recorder.start()
+
+    if isinstance(graph, CSRGraph):
+        forest = _prepost_csr(graph)
+    else:
+        forest = _prepost_graph(graph)
+
+    if recorder:
+        nodes = sum(map(len, forest))
+        edges = graph.num_edges if isinstance(graph, CSRGraph) else sum(map(len, graph.values()))
+        recorder.lap('dfs', mark, nodes, edges)
+    return forest
+
+
+def _prepost_graph(graph: GRAPH) -> list[dict[str, list[int]]]:
     visited = set()
     forest: list[dict[str, list[int]]] = []
     clock = 1
+    neighbors_of = graph.get
+    mark_visited = visited.add
+    stack = []
+    push, pop = stack.append, stack.pop
+
+    for root in graph:
+        if root in visited:
+            continue
 
-    def explore(u: str, tree: dict[str, list[int]]) -> None:
-        nonlocal clock
-        visited.add(u)
-        tree[u] = [clock, -1]
+        mark_visited(root)
+        times = [clock, -1]
+        tree: dict[str, list[int]] = {root: times}
         clock += 1
 
-        for v in graph.get(u, []):
-            if v not in visited:
-                explore(v, tree)
-        
-        tree[u][1] = clock
+        # The current frame lives in locals; suspended frames on the (shared,
+        # empty between trees) stack hold the node's [pre, post] entry and the
+        # iterator over its remaining neighbors
+        neighbors = iter(neighbors_of(root, ()))
+        while True:
+            for v in neighbors:
+                if v not in visited:
+                    mark_visited(v)
+                    push((times, neighbors))
+                    times = [clock, -1]
+                    tree[v] = times
+                    clock += 1
+                    neighbors = iter(neighbors_of(v, ()))
+                    break
+            else:
+                times[1] = clock
+                clock += 1
+                if not stack:
+                    break
+                times, neighbors = pop()
+
+        forest.append(tree)
+
+    return forest
+
+
+def _prepost_csr(csr: CSRGraph) -> list[dict[str, list[int]]]:
+    """The same search as _prepost_graph, over node ids, building the trees as it goes"""
+    labels, offsets, targets = csr.labels, csr.offsets, csr.targets
+    visited = bytearray(len(csr))
+    forest: list[dict[str, list[int]]] = []
+    clock = 1
+    stack = []
+    push, pop = stack.append, stack.pop
+
+    for root in range(len(csr)):
+        if visited[root]:
+            continue
+
+        visited[root] = 1
+        times = [clock, -1]
+        tree: dict[str, list[int]] = {labels[root]: times}
         clock += 1
-    
-    for u in graph.keys():
-        if u not in visited:
-            tree: dict[str, list[int]] = {}
-            explore(u, tree)
-            forest.append(tree)
-    
+
+        neighbors = iter(targets[offsets[root]:offsets[root + 1]])
+        while True:
+            for v in neighbors:
+                if not visited[v]:
+                    visited[v] = 1
+                    push((times, neighbors))
+                    times = [clock, -1]
+                    tree[labels[v]] = times
+                    clock += 1
+                    neighbors = iter(targets[offsets[v]:offsets[v + 1]])
+                    break
+            else:
+                times[1] = clock
+                clock += 1
+                if not stack:
+                    break
+                times, neighbors = pop()
+
+        forest.append(tree)
+
     return forest
 
 
-def find_sccs(graph: GRAPH) -> list[set[str]]:
+@dataclass
+class PhaseStats:
+    """One phase of an instrumented call, or the total of a phase over several calls"""
+    name: str
+    seconds: float
+    nodes: int  # nodes visited
+    edges: int  # edges scanned
+    peak_bytes: int | None = None  # peak allocation above the phase's starting point
+
+
+class PhaseRecorder:
+    """
+    Collects the PhaseStats of every instrumented call made inside record_phases.
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.phases: list[PhaseStats] = []
+        self._baseline = 0
+
+    def start(self) -> int:
+        """Begin a phase; return the mark to pass to lap"""
+        if self.memory:
+            tracemalloc.reset_peak()
+            self._baseline = tracemalloc.get_traced_memory()[0]
+        return perf_counter_ns()
+
+    def lap(self, name: str, mark: int, nodes: int, edges: int) -> int:
+        """End the phase begun at mark and begin the next one"""
+        elapsed = perf_counter_ns() - mark
+        peak = tracemalloc.get_traced_memory()[1] - self._baseline if self.memory else None
+        self.phases.append(PhaseStats(name, elapsed / 1e9, nodes, edges, peak))
+        return self.start()
+
+    def totals(self) -> dict[str, PhaseStats]:
+        """Return the phases summed by name, in order of first appearance; peaks are maxima"""
+        totals: dict[str, PhaseStats] = {}
+        for phase in self.phases:
+            total = totals.get(phase.name)
+            if total is None:
+                totals[phase.name] = PhaseStats(phase.name, phase.seconds, phase.nodes, phase.edges, phase.peak_bytes)
+                continue
+            total.seconds += phase.seconds
+            total.nodes += phase.nodes
+            total.edges += phase.edges
+            if phase.peak_bytes is not None:
+                total.peak_bytes = max(total.peak_bytes, phase.peak_bytes)
+        return totals
+
+
+# The recorder of the innermost active record_phases, checked once per phase
+_recorder: PhaseRecorder | None = None
+
+
+@contextmanager
+def record_phases(memory: bool = False):
+    """
+    Record the phases of find_sccs, scc_summary and prepost calls made in the block:
+
+        with record_phases() as recorder:
+            find_sccs(graph)
+        recorder.totals()['dfs_reverse'].seconds
+
+    Kosaraju runs the phases reverse, dfs_reverse, order and dfs_original, and
+    Tarjan runs reverse and search, on the dictionaries of a GRAPH. find_sccs on a
+    CSRGraph, and scc_summary on either input, work on CSR and start with to_csr,
+    the conversion of a GRAPH (near zero for a CSRGraph). prepost runs dfs. Every
+    phase but order covers the whole graph, so its node and edge counts are those
+    of the graph it scans.
+    With memory, tracemalloc also reports each phase's peak allocation (and slows
+    the timed code down noticeably). Outside the block the instrumentation costs
+    one global lookup per phase.
+    """
+    global _recorder
+    recorder = PhaseRecorder(memory)
+    previous = _recorder
+    startedTracing = memory and not tracemalloc.is_tracing()
+    if startedTracing:
+        tracemalloc.start()
+    _recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _recorder = previous
+        if startedTracing:
+            tracemalloc.stop()
+
+
+def _kosaraju_ids(csr: CSRGraph) -> tuple[array, int]:
+    n = len(csr)
+    recorder = _recorder
+    if recorder:
+        mark = recorder.start()
+
+    # 1. reverse the graph
+    reverseRows = _reverse_rows(csr)
+    if recorder:
+        mark = recorder.lap('reverse', mark, n, csr.num_edges)
+
+    # 2. run DFS on reversed graph; it reports nodes in the order they finish
+    finishOrder = _finish_order_ids(n, reverseRows.__getitem__)
+    del reverseRows
+    if recorder:
+        recorder.lap('dfs_reverse', mark, n, csr.num_edges)
+
+    return _components_from_finish_order(csr, finishOrder)
+
+
+def _reverse_rows(csr: CSRGraph) -> list[list[int]]:
+    """
+    Return the sources of each node's in-edges, as one list per node id.
+    For a single search of the reverse graph this beats csr.reverse(): Python
+    lists of ints are faster to build and to scan than CSR arrays.
+    """
+    offsets, targets = csr.offsets, csr.targets
+    reverseRows: list[list[int]] = [[] for _ in range(len(csr))]
+    for u in range(len(csr)):
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            reverseRows[v].append(u)
+    return reverseRows
+
+
+def _finish_order_ids(n: int, neighbors_of) -> list[int]:
+    """
+    Return the node ids 0..n-1 in the order a DFS in id order finishes them, where
+    neighbors_of(u) gives the out-neighbors of u. Only the finish order is kept.
+    """
+    visited = bytearray(n)
+    finished: list[int] = []
+    finish = finished.append
+    stack = []
+    push, pop = stack.append, stack.pop
+
+    for root in range(n):
+        if visited[root]:
+            continue
+
+        visited[root] = 1
+        u = root
+        neighbors = iter(neighbors_of(root))
+        while True:
+            for v in neighbors:
+                if not visited[v]:
+                    visited[v] = 1
+                    push((u, neighbors))
+                    u = v
+                    neighbors = iter(neighbors_of(v))
+                    break
+            else:
+                finish(u)
+                if not stack:
+                    break
+                u, neighbors = pop()
+
+    return finished
+
+
+def _components_from_finish_order(csr: CSRGraph, finishOrder: list[int]) -> tuple[array, int]:
+    """The last two Kosaraju steps, given the finish order of a DFS of the reverse graph"""
+    n = len(csr)
+    offsets, targets = csr.offsets, csr.targets
+    recorder = _recorder
+    if recorder:
+        mark = recorder.start()
+
+    # 3. descending postorder is just the finish order backwards
+    nodesInPostOrder = reversed(finishOrder)
+    if recorder:
+        mark = recorder.lap('order', mark, n, 0)
+
+    # 4. search the original graph in the order of the nodes from the postorder list;
+    # the unvisited nodes reached from each start are one component
+    visited = bytearray(n)
+    componentOf = _new_numbering(n)
+    count = 0
+    stack = []
+    push, pop = stack.append, stack.pop
+    for root in nodesInPostOrder:
+        if visited[root]:
+            continue
+
+        visited[root] = 1
+        componentOf[root] = count
+        push(root)
+        while stack:
+            u = pop()
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if not visited[v]:
+                    visited[v] = 1
+                    componentOf[v] = count
+                    push(v)
+        count += 1
+    if recorder:
+        recorder.lap('dfs_original', mark, n, csr.num_edges)
+
+    return componentOf, count
+
+
+def _pearce_ids(csr: CSRGraph) -> tuple[array, int]:
+    """
+    Pearce's space-efficient variant of Tarjan's algorithm, run iteratively.
+    A single rindex list serves as visited flag, lowlink and, once a node's
+    component is complete, its component number.
+
+    The search runs on the reverse graph: a component is completed when its first
+    discovered node finishes, so the completion order is the ascending order of
+    the reverse-graph post numbers that Kosaraju sorts by. Numbering components
+    backwards from that order gives the same sink-to-source list as Kosaraju
+    without the sort or the second traversal.
+    """
+    n = len(csr)
+    recorder = _recorder
+    if recorder:
+        mark = recorder.start()
+    reverseRows = _reverse_rows(csr)
+    if recorder:
+        mark = recorder.lap('reverse', mark, n, csr.num_edges)
+
+    # The current frame keeps its lowlink and root flag in locals; suspended
+    # frames hold them with the node and the iterator over its remaining neighbors
+    rindex = [0] * n
+    pending: list[int] = []  # finished nodes whose component is not complete yet
+    index = 1
+    component = n - 1  # counts down so completed nodes outrank every live index
+    stack = []
+    push, pop = stack.append, stack.pop
+
+    for root in range(n):
+        if rindex[root]:
+            continue
+
+        u = root
+        low = rindex[u] = index
+        index += 1
+        isRoot = True
+        neighbors = iter(reverseRows[u])
+        while True:
+            for w in neighbors:
+                wIndex = rindex[w]
+                if not wIndex:
+                    push((u, low, isRoot, neighbors))
+                    u = w
+                    low = rindex[u] = index
+                    index += 1
+                    isRoot = True
+                    neighbors = iter(reverseRows[u])
+                    break
+                if wIndex < low:
+                    low = wIndex
+                    isRoot = False
+            else:
+                if isRoot:
+                    index -= 1
+                    while pending and low <= rindex[pending[-1]]:
+                        rindex[pending.pop()] = component
+                        index -= 1
+                    rindex[u] = component
+                    component -= 1
+                else:
+                    rindex[u] = low
+                    pending.append(u)
+
+                if not stack:
+                    break
+                # A completed child's root index is above its parent's lowlink
+                childLow = low
+                u, low, isRoot, neighbors = pop()
+                if childLow < low:
+                    low = childLow
+                    isRoot = False
+
+    # Components were numbered n-1, n-2, ... in completion order; shift so the
+    # last one completed (the sink-most) is component 0
+    count = n - 1 - component
+    componentOf = array(OFFSET_TYPECODE, [r - component - 1 for r in rindex])
+    if recorder:
+        recorder.lap('search', mark, n, csr.num_edges)
+
+    return componentOf, count
+
+
+SCC_ALGORITHMS = {
+    'kosaraju': _kosaraju_ids,
+    'tarjan': _pearce_ids,
+}
+
+
+def _component_ids(csr: CSRGraph, algorithm: str) -> tuple[array, int]:
+    if algorithm not in SCC_ALGORITHMS:
+        raise ValueError(f"Unknown SCC algorithm {algorithm!r}, expected one of {list(SCC_ALGORITHMS)}")
+    return SCC_ALGORITHMS[algorithm](csr)
+
+
+def find_sccs(graph: GRAPH | CSRGraph, algorithm: str = 'kosaraju') -> list[set[str]]:
     """
     Return a list of the strongly connected components in the graph.
     The list should be returned in order of sink-to-source
+
+    algorithm is 'kosaraju' (two DFS passes) or 'tarjan' (a single pass of
+    Pearce's variant); both return the same list.
     """
-    
-    # 1. reverse the graph 
-    reverseGraph: GRAPH = {}
-
-    # Initialize all nodes in reverse graph
-    for node in graph:
-        reverseGraph[node] = []
-
-    # Add reversed edges
-    for node in graph:
-        for neighbor in graph[node]:
-            if neighbor not in reverseGraph:
-                reverseGraph[neighbor] = []
-            reverseGraph[neighbor].append(node)
-
-    # 2. run DFS on reversed graph to get postorder numbers
-    reverseGraphPostOrderForest = prepost(reverseGraph) 
-
-    # 3. order the list of nodes from the graph by descending postorder
-    all_nodes_with_post = []
-    for tree in reverseGraphPostOrderForest:
-        for node, times in tree.items():
-            post_time = times[1]
-            all_nodes_with_post.append((node, post_time))
-
-    # Sort by post-order time in descending order
-    all_nodes_with_post.sort(key=lambda x: x[1], reverse=True)
-
-    # Extract just the node names
-    nodesInPostOrder = [node for node, post_time in all_nodes_with_post]
-
-    originalGraphPostOrder: GRAPH = {v: graph.get(v, []) for v in nodesInPostOrder}
-    for v in graph:
-        if v not in originalGraphPostOrder:
-            originalGraphPostOrder[v] = graph[v]
-    
-    # 4. run DFS on original graph in the order of the nodes from the postorder list
-    unformattedSCCs = prepost(originalGraphPostOrder)
-    sccList = []
-
-    for scc in unformattedSCCs:
-        sccList.append(set(scc))
+    if not isinstance(graph, CSRGraph) and algorithm in _GRAPH_ALGORITHMS:
+        return _GRAPH_ALGORITHMS[algorithm](graph)
+
+    csr = _recorded_csr(graph)
+    componentOf, count = _component_ids(csr, algorithm)
+    return _component_sets(csr, componentOf, count)
+
+
+def _recorded_csr(graph: GRAPH | CSRGraph) -> CSRGraph:
+    """as_csr, recorded as the to_csr phase"""
+    recorder = _recorder
+    if recorder:
+        mark = recorder.start()
+    csr = as_csr(graph)
+    if recorder:
+        recorder.lap('to_csr', mark, len(csr), csr.num_edges)
+    return csr
+
+
+def _finish_order(graph: GRAPH) -> list[str]:
+    """Return the nodes of graph in the order a DFS in key order finishes them"""
+    visited = set()
+    finished: list[str] = []
+    mark_visited, finish = visited.add, finished.append
+
+    for root in graph:
+        if root in visited:
+            continue
+
+        mark_visited(root)
+        u = root
+        neighbors = iter(graph[root])
+        stack = []
+        push, pop = stack.append, stack.pop
+        while True:
+            for v in neighbors:
+                if v not in visited:
+                    mark_visited(v)
+                    push((u, neighbors))
+                    u = v
+                    neighbors = iter(graph[v])
+                    break
+            else:
+                finish(u)
+                if not stack:
+                    break
+                u, neighbors = pop()
+
+    return finished
+
+
+def _reverse_graph(graph: GRAPH) -> GRAPH:
+    """Reverse a GRAPH; neighbors that are not keys become nodes too"""
+    reverseGraph: GRAPH = {node: [] for node in graph}
+    for node, neighbors in graph.items():
+        for neighbor in neighbors:
+            sources = reverseGraph.get(neighbor)
+            if sources is None:
+                sources = reverseGraph[neighbor] = []
+            sources.append(node)
+    return reverseGraph
+
+
+def _kosaraju_sets(graph: GRAPH) -> list[set[str]]:
+    """Kosaraju on the dictionaries themselves, for GRAPH input"""
+    recorder = _recorder
+    if recorder:
+        mark = recorder.start()
+
+    # 1. reverse the graph
+    reverseGraph = _reverse_graph(graph)
+    if recorder:
+        edges = sum(map(len, graph.values()))
+        mark = recorder.lap('reverse', mark, len(reverseGraph), edges)
+
+    # 2. run DFS on reversed graph; it reports nodes in the order they finish
+    finishOrder = _finish_order(reverseGraph)
+    if recorder:
+        mark = recorder.lap('dfs_reverse', mark, len(reverseGraph), edges)
+
+    # 3. descending postorder is just the finish order backwards
+    nodesInPostOrder = reversed(finishOrder)
+    if recorder:
+        mark = recorder.lap('order', mark, len(reverseGraph), 0)
+
+    # 4. search the original graph in the order of the nodes from the postorder list;
+    # the unvisited nodes reached from each start are one component
+    neighbors_of = graph.get
+    visited = set()
+    mark_visited = visited.add
+    sccList: list[set[str]] = []
+    for root in nodesInPostOrder:
+        if root in visited:
+            continue
+
+        mark_visited(root)
+        component = {root}
+        member = component.add
+        stack = [root]
+        push, pop = stack.append, stack.pop
+        while stack:
+            for v in neighbors_of(pop(), ()):
+                if v not in visited:
+                    mark_visited(v)
+                    member(v)
+                    push(v)
+        sccList.append(component)
+    if recorder:
+        recorder.lap('dfs_original', mark, len(reverseGraph), edges)
 
     return sccList
 
 
-def classify_edges(graph: GRAPH, trees: list[dict[str, list[int]]]) -> dict[str, set[tuple[str, str]]]:
+def _pearce_sets(graph: GRAPH) -> list[set[str]]:
     """
-    Return a dictionary containing sets of each class of edges
+    _pearce_ids on the dictionaries themselves, for GRAPH input. Each component's
+    set is built as it completes; completion order is source-to-sink, so the list
+    is reversed at the end.
     """
+    recorder = _recorder
+    if recorder:
+        mark = recorder.start()
+    reverseGraph = _reverse_graph(graph)
+    if recorder:
+        edges = sum(map(len, graph.values()))
+        mark = recorder.lap('reverse', mark, len(reverseGraph), edges)
+
+    # rindex holds a node's discovery index while it is on the search path, its
+    # lowlink once it finishes, and a completed component's number after that.
+    # The current frame keeps its lowlink and root flag in locals; suspended
+    # frames hold them with the node and the iterator over its remaining neighbors
+    rindex: dict[str, int] = {}
+    indexOf = rindex.get
+    pending: list[str] = []  # finished nodes whose component is not complete yet
+    sccList: list[set[str]] = []
+    index = 1
+    component = len(reverseGraph) - 1  # counts down so completed nodes outrank every live index
+    stack = []
+    push, pop = stack.append, stack.pop
 
-    # 1. Get prepost numbers in a nice format
+    for root in reverseGraph:
+        if root in rindex:
+            continue
 
-    prepostForest = trees
+        u = root
+        low = rindex[u] = index
+        index += 1
+        isRoot = True
+        neighbors = iter(reverseGraph[u])
+        while True:
+            for w in neighbors:
+                wIndex = indexOf(w)
+                if wIndex is None:
+                    push((u, low, isRoot, neighbors))
+                    u = w
+                    low = rindex[u] = index
+                    index += 1
+                    isRoot = True
+                    neighbors = iter(reverseGraph[u])
+                    break
+                if wIndex < low:
+                    low = wIndex
+                    isRoot = False
+            else:
+                if isRoot:
+                    index -= 1
+                    members = {u}
+                    while pending and low <= rindex[pending[-1]]:
+                        v = pending.pop()
+                        rindex[v] = component
+                        members.add(v)
+                        index -= 1
+                    rindex[u] = component
+                    component -= 1
+                    sccList.append(members)
+                else:
+                    rindex[u] = low
+                    pending.append(u)
 
-    prepostNodes: dict[str, tuple[int, int]] = {}
-    for tree in prepostForest:
-        for entry in tree.items():
-            node = entry[0]
-            prepostList = entry[1]
-            preNumber = prepostList[0]
-            postNumber = prepostList[1]
-            prepostNodes[node] = (preNumber, postNumber)
+                if not stack:
+                    break
+                # A completed child's root index is above its parent's lowlink
+                childLow = low
+                u, low, isRoot, neighbors = pop()
+                if childLow < low:
+                    low = childLow
+                    isRoot = False
 
-    # 2. Make an edge list
+    sccList.reverse()
+    if recorder:
+        recorder.lap('search', mark, len(reverseGraph), edges)
+
+    return sccList
+
+
+# find_sccs algorithms that run on a GRAPH without converting it to CSR
+_GRAPH_ALGORITHMS = {
+    'kosaraju': _kosaraju_sets,
+    'tarjan': _pearce_sets,
+}
+
+
+def _component_sets(csr: CSRGraph, componentOf: array, count: int) -> list[set[str]]:
+    labels = csr.labels
+    sccList: list[set[str]] = [set() for _ in range(count)]
+    for u in range(len(csr)):
+        sccList[componentOf[u]].add(labels[u])
+
+    return sccList
 
-    edgeList: list[tuple[str, str]] = []
-    for node in graph:
-        for neighbor in graph[node]:
-            edgeList.append((node, neighbor))
-    for node in graph:
-        for neighbor in graph[node]:
-            edgeList.append((node, neighbor))
 
-    # 3. Classify each edge based on rules for prepost numbers
+# Edge class codes, as stored per CSR edge by edge_class_codes
+TREE_FORWARD, BACK, CROSS = 0, 1, 2
+EDGE_CLASSES = ('tree/forward', 'back', 'cross')
 
+
+def _edge_classes_during_dfs(csr: CSRGraph) -> bytearray:
+    """
+    Classify every edge while running the same DFS as prepost.
+    When u scans the edge to an already visited v, v is an ancestor of u if it has
+    not finished yet, a descendant if it finished after u was discovered, and
+    otherwise in an earlier subtree.
+    """
+    n = len(csr)
+    offsets, targets = csr.offsets, csr.targets
+    order = _new_numbering(n)  # discovery number, zero means unvisited
+    finished = bytearray(n)
+    codes = bytearray(len(targets))  # every edge starts out as tree/forward
+    clock = 1
+
+    for root in range(n):
+        if order[root]:
+            continue
+
+        u = root
+        order[u] = clock
+        clock += 1
+        edges = iter(range(offsets[u], offsets[u + 1]))
+        stack = []
+        push, pop = stack.append, stack.pop
+        while True:
+            for i in edges:
+                v = targets[i]
+                if not order[v]:
+                    push((u, edges))
+                    u = v
+                    order[u] = clock
+                    clock += 1
+                    edges = iter(range(offsets[u], offsets[u + 1]))
+                    break
+                if finished[v]:
+                    if order[v] < order[u]:
+                        codes[i] = CROSS
+                elif v != u:
+                    codes[i] = BACK
+                else:
+                    # a self-loop has equal intervals, which the pre/post rules call cross
+                    codes[i] = CROSS
+            else:
+                finished[u] = 1
+                if not stack:
+                    break
+                u, edges = pop()
+
+    return codes
+
+
+def _edge_classes_from_trees(csr: CSRGraph, trees: list[dict[str, list[int]]]) -> bytearray:
+    ids = csr.ids
+
+    # 1. Get prepost numbers into flat arrays indexed by node id
+    pre, post = _new_numbering(len(csr)), _new_numbering(len(csr))
+    for tree in trees:
+        for node, (preNumber, postNumber) in tree.items():
+            u = ids[node]
+            pre[u] = preNumber
+            post[u] = postNumber
+
+    return _edge_classes_from_numbering(csr, pre, post)
+
+
+def _edge_classes_from_numbering(csr: CSRGraph, pre: array, post: array) -> bytearray:
+    offsets, targets = csr.offsets, csr.targets
+
+    # 2. Classify each edge based on rules for prepost numbers
+    codes = bytearray(len(targets))
+    for u in range(len(csr)):
+        uPre, uPost = pre[u], post[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            # if u is an ancestor of v
+            if uPre < pre[v] and uPost > post[v]:
+                continue
+            # if v is an ancestor of u
+            elif pre[v] < uPre and post[v] > uPost:
+                codes[i] = BACK
+            # if they are cross
+            else:
+                codes[i] = CROSS
+
+    return codes
+
+
+def edge_class_codes(graph: GRAPH | CSRGraph, trees: list[dict[str, list[int]]] | None = None) -> bytearray:
+    """
+    Return one byte per edge, in CSR edge order, holding its class code
+    (an index into EDGE_CLASSES).
+    Without trees the edges are classified during a DFS in key order, which gives
+    the same result as passing prepost(graph).
+    """
+    csr = as_csr(graph)
+    if trees is None:
+        return _edge_classes_during_dfs(csr)
+    return _edge_classes_from_trees(csr, trees)
+
+
+def classify_edges(graph: GRAPH | CSRGraph, trees: list[dict[str, list[int]]] | None = None,
+                   counts_only: bool = False) -> dict[str, set[tuple[str, str]]] | dict[str, int]:
+    """
+    Return a dictionary containing sets of each class of edges.
+    If trees is omitted, edges are classified against a fresh DFS of the graph.
+    With counts_only, return the sizes of those sets instead: a neighbor listed more
+    than once is one edge, counted once.
+    A GRAPH is classified on its dictionaries, like prepost searches them.
+    """
+    if isinstance(graph, CSRGraph):
+        codes = edge_class_codes(graph, trees)
+        if counts_only:
+            return count_edge_classes(graph, codes)
+        return _edge_sets(graph, codes)
+
+    # 1. Get prepost numbers for every node in one dictionary
+    if trees is None:
+        trees = _prepost_graph(graph)
+    numbers: dict[str, list[int]] = {}
+    for tree in trees:
+        numbers.update(tree)
+
+    if counts_only:
+        return _count_graph_edge_classes(graph, numbers)
+    return _graph_edge_sets(graph, numbers)
+
+
+def _graph_edge_sets(graph: GRAPH, numbers: dict[str, list[int]]) -> dict[str, set[tuple[str, str]]]:
     treeForwardSet: set[tuple[str, str]] = set()
     backSet: set[tuple[str, str]] = set()
     crossSet: set[tuple[str, str]] = set()
 
-    for edge in edgeList:
-        fromNode = edge[0]
-        toNode = edge[1]
-        fromNodePrepost = prepostNodes[fromNode]
-        toNodePrepost = prepostNodes[toNode]
-        # if fromNode is an ancestor of toNode
-        if fromNodePrepost[0] < toNodePrepost[0] and fromNodePrepost[1] > toNodePrepost[1]:
-            treeForwardSet.add(edge)
+    # 2. Classify each edge based on rules for prepost numbers
+    for fromNode, neighbors in graph.items():
+        fromPre, fromPost = numbers[fromNode]
+        for toNode in neighbors:
+            toPre, toPost = numbers[toNode]
+            # if fromNode is an ancestor of toNode
+            if fromPre < toPre and fromPost > toPost:
+                treeForwardSet.add((fromNode, toNode))
             # if toNode is an ancestor of fromNode
-        elif toNodePrepost[0] < fromNodePrepost[0] and toNodePrepost[1] > fromNodePrepost[1]:
-            backSet.add(edge)
+            elif toPre < fromPre and toPost > fromPost:
+                backSet.add((fromNode, toNode))
             # if they are cross
-        else:
-            crossSet.add(edge)
+            else:
+                crossSet.add((fromNode, toNode))
+
+    return dict(zip(EDGE_CLASSES, (treeForwardSet, backSet, crossSet)))
+
+
+def _count_graph_edge_classes(graph: GRAPH, numbers: dict[str, list[int]]) -> dict[str, int]:
+    treeForward = back = cross = 0
+
+    # 2. Classify each distinct edge based on rules for prepost numbers
+    for fromNode, neighbors in graph.items():
+        fromPre, fromPost = numbers[fromNode]
+        if len(neighbors) > 1 and len(set(neighbors)) < len(neighbors):
+            neighbors = dict.fromkeys(neighbors)
+        for toNode in neighbors:
+            toPre, toPost = numbers[toNode]
+            if fromPre < toPre and fromPost > toPost:
+                treeForward += 1
+            elif toPre < fromPre and toPost > fromPost:
+                back += 1
+            else:
+                cross += 1
+
+    return dict(zip(EDGE_CLASSES, (treeForward, back, cross)))
+
+
+def count_edge_classes(graph: GRAPH | CSRGraph, codes: bytearray) -> dict[str, int]:
+    """
+    Return the number of distinct edges in each class, given the graph's
+    edge_class_codes; repeated neighbors count once, as in classify_edges.
+    """
+    counts = [codes.count(code) for code in range(len(EDGE_CLASSES))]
+
+    # Copies of an edge always share its class, so drop all but the first.
+    # Only rows that repeat a neighbor need the per-edge pass, and a CSRGraph
+    # remembers whether it has any
+    if isinstance(graph, CSRGraph):
+        rows = graph.rows() if graph.has_repeated_edges else ()
+    else:
+        rows = graph.values()
+    start = 0
+    for row in rows:
+        if len(row) > 1 and len(set(row)) < len(row):
+            seen = set()
+            for i, v in enumerate(row, start):
+                if v in seen:
+                    counts[codes[i]] -= 1
+                else:
+                    seen.add(v)
+        start += len(row)
+
+    return dict(zip(EDGE_CLASSES, counts))
+
+
+def _edge_sets(csr: CSRGraph, codes: bytearray) -> dict[str, set[tuple[str, str]]]:
+    labels, offsets, targets = csr.labels, csr.offsets, csr.targets
+    edgeSets: tuple[set[tuple[str, str]], ...] = (set(), set(), set())
+    for u in range(len(csr)):
+        fromNode = labels[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            edgeSets[codes[i]].add((fromNode, labels[targets[i]]))
+
+    return dict(zip(EDGE_CLASSES, edgeSets))
+
+
+class _Descending:
+    """Heap entry that inverts label order, so heapq keeps the largest label on top"""
+    __slots__ = ('label',)
+
+    def __init__(self, label: str):
+        self.label = label
+
+    def __lt__(self, other: '_Descending') -> bool:
+        return self.label > other.label
+
+
+@dataclass
+class SCCSummary:
+    """
+    Compact SCC results: component ids instead of per-component sets.
+    Components are numbered sink-to-source, in the same order find_sccs returns them.
+    """
+    labels: list[str]
+    component_of: array  # component id for each node id
+    sizes: array  # number of nodes in each component
+    size_histogram: dict[int, int]  # component size -> how many components have it
+    edge_counts: dict[str, int] | None = None  # edges per class, if requested
+
+    @property
+    def count(self) -> int:
+        return len(self.sizes)
+
+    def members(self, component: int) -> list[str]:
+        """Return the labels in one component, in node id order"""
+        labels, componentOf = self.labels, self.component_of
+        return [labels[u] for u in range(len(labels)) if componentOf[u] == component]
+
+    def top_components(self, k: int, sample_size: int = 5) -> list[tuple[int, int, list[str]]]:
+        """
+        Return (component id, size, sample) for the k largest components, largest first,
+        with ties in component id order. Each sample holds the sample_size smallest
+        labels of its component, sorted.
+        Runs in O(V + k log k): the size histogram gives the cutoff size, so no
+        ordering of all the components is needed.
+        """
+        sizes = self.sizes
+        k = min(k, self.count)
+        if k <= 0:
+            return []
+
+        # 1. find the smallest size that still makes the top k, and how many
+        # components of exactly that size fit
+        remaining = k
+        for cutoff in sorted(self.size_histogram, reverse=True):
+            if self.size_histogram[cutoff] >= remaining:
+                break
+            remaining -= self.size_histogram[cutoff]
+
+        # 2. pick the components above the cutoff and the first few at it
+        chosen = []
+        for component in range(self.count):
+            size = sizes[component]
+            if size > cutoff:
+                chosen.append(component)
+            elif size == cutoff and remaining:
+                chosen.append(component)
+                remaining -= 1
+        chosen.sort(key=lambda component: -sizes[component])
+
+        # 3. keep a bounded max-heap of the smallest labels seen in each chosen component
+        samples: dict[int, list[str]] = {component: [] for component in chosen}
+        labels, componentOf = self.labels, self.component_of
+        for u in range(len(labels)):
+            sample = samples.get(componentOf[u])
+            if sample is None:
+                continue
+            if len(sample) < sample_size:
+                heappush(sample, _Descending(labels[u]))
+            elif sample and labels[u] < sample[0].label:
+                heapreplace(sample, _Descending(labels[u]))
+
+        return [
+            (component, sizes[component], sorted(entry.label for entry in samples[component]))
+            for component in chosen
+        ]
+
+
+def scc_summary(graph: GRAPH | CSRGraph, algorithm: str = 'kosaraju', classify: bool = False) -> SCCSummary:
+    """
+    Return the SCCs of the graph as an SCCSummary without building a set per component.
+    With classify, also count the edges in each class of a DFS in key order.
+    """
+    csr = _recorded_csr(graph)
+    componentOf, count = _component_ids(csr, algorithm)
+    edgeCounts = classify_edges(csr, counts_only=True) if classify else None
+    return _summary_from_ids(csr, componentOf, count, edgeCounts)
+
+
+def _summary_from_ids(csr: CSRGraph, componentOf: array, count: int,
+                      edgeCounts: dict[str, int] | None = None) -> SCCSummary:
+    sizes = _new_numbering(count)
+    for component in componentOf:
+        sizes[component] += 1
+
+    return SCCSummary(
+        labels=csr.labels,
+        component_of=array(NODE_TYPECODE, componentOf),
+        sizes=sizes,
+        size_histogram=dict(sorted(Counter(sizes).items())),
+        edge_counts=edgeCounts,
+    )
+
+
+@dataclass
+class Condensation:
+    """
+    The DAG of strongly connected components, with duplicate edges removed.
+    Component ids are the sink-to-source ids of scc_summary, so every edge goes from
+    a higher id to a lower one and descending id order is a topological order.
+    The successors of component c are targets[offsets[c]:offsets[c + 1]], ascending.
+    """
+    component_of: array
+    sizes: array
+    offsets: array
+    targets: array
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def successors(self, component: int):
+        return self.targets[self.offsets[component]:self.offsets[component + 1]]
+
+
+def condensation(graph: GRAPH | CSRGraph, summary: SCCSummary | None = None,
+                 algorithm: str = 'kosaraju') -> Condensation:
+    """
+    Return the condensation DAG of the graph in linear time.
+    Pass the graph's SCCSummary to reuse its component ids instead of finding the SCCs again.
+    """
+    csr = as_csr(graph)
+    if summary is None:
+        summary = scc_summary(csr, algorithm)
+    componentOf, sizes = summary.component_of, summary.sizes
+    count = len(sizes)
+    offsets, targets = csr.offsets, csr.targets
+
+    # 1. group the node ids by component (a counting sort on component id)
+    starts = [0] * (count + 1)
+    for c in range(count):
+        starts[c + 1] = starts[c] + sizes[c]
+    nextSlot = starts[:count]
+    byComponent = array(NODE_TYPECODE, [0]) * len(csr)
+    for u in range(len(csr)):
+        c = componentOf[u]
+        byComponent[nextSlot[c]] = u
+        nextSlot[c] += 1
+
+    # 2. scan each component's out-edges, stamping targets so each pair is kept once
+    lastSeen = array(NODE_TYPECODE, [-1]) * count
+    dagOffsets = array(OFFSET_TYPECODE, [0])
+    pairSources, pairTargets = [], []
+    inStarts = [0] * (count + 1)
+    for c in range(count):
+        for u in byComponent[starts[c]:starts[c + 1]]:
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                d = componentOf[v]
+                if d != c and lastSeen[d] != c:
+                    lastSeen[d] = c
+                    pairSources.append(c)
+                    pairTargets.append(d)
+                    inStarts[d + 1] += 1
+        dagOffsets.append(len(pairTargets))
+
+    # 3. group the pairs by target component (a second counting sort), then visit
+    #    the targets in ascending order so every row is written already sorted
+    for d in range(count):
+        inStarts[d + 1] += inStarts[d]
+    nextSlot = inStarts[:count]
+    byTarget = [0] * len(pairTargets)
+    for c, d in zip(pairSources, pairTargets):
+        byTarget[nextSlot[d]] = c
+        nextSlot[d] += 1
+    dagTargets = [0] * len(pairTargets)
+    nextSlot = dagOffsets.tolist()
+    for d in range(count):
+        for c in byTarget[inStarts[d]:inStarts[d + 1]]:
+            dagTargets[nextSlot[c]] = d
+            nextSlot[c] += 1
+
+    return Condensation(componentOf, sizes, dagOffsets, array(NODE_TYPECODE, dagTargets))
+
+
+@dataclass
+class DFSForest:
+    """One full DFS of a CSRGraph, as returned by _dfs, with its pre/post numbering"""
+    pre: array
+    post: array
+    discovered: list[int]  # node ids in discovery order
+    tree_starts: list[int]  # index in discovered where each tree starts
+    finished: list[int]  # node ids in ascending post number
+
+
+def _full_forest(csr: CSRGraph) -> DFSForest:
+    n = len(csr)
+    pre, post = _new_numbering(n), _new_numbering(n)
+    discovered, treeStarts, finished = _dfs(csr, range(n), pre, post)
+    return DFSForest(pre, post, discovered, treeStarts, finished)
+
+
+class AnalysisSession:
+    """
+    The analyses of one graph, each computed on first use and shared afterwards.
+    The forward DFS forest backs prepost and the edge classes; the reverse graph
+    and its DFS finish order back the SCCs (found as by find_sccs with Kosaraju), so no
+    traversal runs more than once however many queries the session answers.
+    """
+
+    def __init__(self, graph: GRAPH | CSRGraph):
+        self.csr = as_csr(graph)
+
+    @cached_property
+    def forward_forest(self) -> DFSForest:
+        """The DFS of the graph in key order"""
+        return _full_forest(self.csr)
+
+    @cached_property
+    def reverse_graph(self) -> CSRGraph:
+        return self.csr.reverse()
+
+    @cached_property
+    def reverse_finish_order(self) -> list[int]:
+        """The node ids in the order a DFS of the reverse graph in key order finishes them"""
+        return _finish_order_ids(len(self.csr), self.reverse_graph.neighbors)
+
+    @cached_property
+    def summary(self) -> SCCSummary:
+        componentOf, count = _components_from_finish_order(self.csr, self.reverse_finish_order)
+        return _summary_from_ids(self.csr, componentOf, count)
+
+    @cached_property
+    def sccs(self) -> list[set[str]]:
+        """The find_sccs result, sink-to-source"""
+        summary = self.summary
+        return _component_sets(self.csr, summary.component_of, summary.count)
 
-    classification = {
-        # type: ignore
-        'tree/forward': treeForwardSet,
-        'back': backSet,
-        'cross': crossSet
-    }
+    @cached_property
+    def prepost(self) -> list[dict[str, list[int]]]:
+        """The prepost result"""
+        forest = self.forward_forest
+        return _forest_labels(self.csr, forest.discovered, forest.tree_starts, forest.pre, forest.post)
 
-    return classification
+    @cached_property
+    def edge_class_codes(self) -> bytearray:
+        """The edge_class_codes result, read off the forward forest's numbering"""
+        forest = self.forward_forest
+        return _edge_classes_from_numbering(self.csr, forest.pre, forest.post)
 
+    def classify_edges(self, counts_only: bool = False) -> dict[str, set[tuple[str, str]]] | dict[str, int]:
+        """The classify_edges result for the forward forest"""
+        if counts_only:
+            return count_edge_classes(self.csr, self.edge_class_codes)
+        return _edge_sets(self.csr, self.edge_class_codes)
 
+    @cached_property
+    def condensation(self) -> Condensation:
+        return condensation(self.csr, self.summary)
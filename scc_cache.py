@@ -0,0 +1,117 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Callable
+
+from scc import GRAPH, CSRGraph, SCCSummary, as_csr, edge_class_codes, prepost, scc_summary
+
+# Bump when the stored form of any result changes, so old entries are ignored
+CACHE_VERSION = 1
+
+
+def graph_fingerprint(graph: GRAPH | CSRGraph) -> str:
+    """
+    Return a hex digest of the graph's labels and CSR arrays.
+    A GRAPH and its CSR form have the same fingerprint.
+    """
+    csr = as_csr(graph)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(len(csr).to_bytes(8, 'little'))
+    for label in csr.labels:
+        digest.update(label.encode('utf-8'))
+        digest.update(b'\0')
+    digest.update(memoryview(csr.offsets).cast('B'))
+    digest.update(memoryview(csr.targets).cast('B'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    An on-disk cache of SCC, prepost and edge-classification results keyed by graph
+    fingerprint, holding at most max_bytes of entries.
+    Entries are pickles, so only point it at a directory you trust. Each hit refreshes
+    the entry's modification time, and the least recently used entries are deleted
+    first when the cache is over its limit.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 1 << 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, fingerprint: str, name: str) -> str:
+        return os.path.join(self.directory, f'{fingerprint}-{name}-v{CACHE_VERSION}.pickle')
+
+    def get_or_compute(self, graph: GRAPH | CSRGraph, name: str, compute: Callable):
+        """
+        Return the result stored under name for this graph, or compute(csr), store
+        it and return it.
+        """
+        csr = as_csr(graph)
+        path = self._path(graph_fingerprint(csr), name)
+        try:
+            with open(path, 'rb') as file:
+                result = pickle.load(file)
+            os.utime(path)
+            return result
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        result = compute(csr)
+
+        # Write to a temporary file first so readers never see a partial entry
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(descriptor, 'wb') as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+        self._evict()
+        return result
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pickle'):
+                # Another process sharing the directory may have evicted it already
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def scc_summary(self, graph: GRAPH | CSRGraph, algorithm: str = 'kosaraju') -> SCCSummary:
+        csr = as_csr(graph)
+
+        # The labels are part of the graph, so store everything else
+        def compute(csr: CSRGraph):
+            summary = scc_summary(csr, algorithm)
+            return summary.component_of, summary.sizes, summary.size_histogram
+
+        componentOf, sizes, histogram = self.get_or_compute(csr, f'scc-{algorithm}', compute)
+        return SCCSummary(csr.labels, componentOf, sizes, histogram)
+
+    def find_sccs(self, graph: GRAPH | CSRGraph, algorithm: str = 'kosaraju') -> list[set[str]]:
+        summary = self.scc_summary(graph, algorithm)
+        sccList: list[set[str]] = [set() for _ in range(summary.count)]
+        for label, component in zip(summary.labels, summary.component_of):
+            sccList[component].add(label)
+        return sccList
+
+    def prepost(self, graph: GRAPH | CSRGraph) -> list[dict[str, list[int]]]:
+        return self.get_or_compute(graph, 'prepost', prepost)
+
+    def edge_class_codes(self, graph: GRAPH | CSRGraph) -> bytearray:
+        """Cached edge_class_codes for the DFS in key order (the prepost forest)"""
+        return self.get_or_compute(graph, 'edge-classes', edge_class_codes)
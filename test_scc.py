@@ -1,6 +1,20 @@
+import gc
+import os
+
+import pytest
 from byu_pytest_utils import tier
 
-from scc import prepost, find_sccs, classify_edges
+from analyze_with_scc import load_wiki_graph, load_wiki_votes
+from benchmark import measure, summarize
+from graph_file import open_graph_file, write_graph_file
+from graphs import generate_graph_vectorized, load_edge_file, write_graph_chunks
+from incremental_scc import IncrementalSCC
+from regression import compare_runtimes, mann_whitney_p
+from run_scc_analysis import check_regression
+from runtime_data import RunInfo, append_results, load_results
+from sampling import forest_fire_sample, sample_subgraph
+from scc import AnalysisSession, CSRGraph, as_csr, record_phases, prepost, find_sccs, classify_edges, edge_class_codes, scc_summary, condensation
+from scc_cache import ResultCache, graph_fingerprint
 
 baseline = tier('baseline', 1)
 core = tier('core', 2)
@@ -86,6 +100,18 @@ def test_prepost_2():
     assert post_numbers == expected_post_numbers
 
 
+@baseline
+def test_prepost_long_chain():
+    n = 50000
+    chain = {f'n{i}': [f'n{i + 1}'] for i in range(n)}
+
+    trees = prepost(chain)
+
+    assert len(trees) == 1
+    assert trees[0]['n0'] == [1, 2 * (n + 1)]
+    assert trees[0][f'n{n}'] == [n + 1, n + 2]
+
+
 @core
 def test_scc():
     expected_sccs = [
@@ -114,6 +140,316 @@ def test_scc_2():
     assert sccs == expected_sccs
 
 
+@core
+def test_scc_tarjan():
+    assert find_sccs(graph1, algorithm='tarjan') == find_sccs(graph1)
+    assert find_sccs(graph2, algorithm='tarjan') == find_sccs(graph2)
+
+    n = 50000
+    cycle = {f'n{i}': [f'n{(i + 1) % n}'] for i in range(n)}
+    assert find_sccs(cycle, algorithm='tarjan') == [set(cycle)]
+
+
+@core
+def test_scc_summary():
+    summary = scc_summary(graph1, classify=True)
+
+    assert summary.count == 5
+    assert list(summary.sizes) == [5, 1, 1, 3, 2]
+    assert summary.size_histogram == {1: 2, 2: 1, 3: 1, 5: 1}
+    assert summary.edge_counts == {'tree/forward': 11, 'back': 3, 'cross': 5}
+    assert [set(summary.members(c)) for c in range(summary.count)] == find_sccs(graph1)
+    assert summary.top_components(3, sample_size=2) == [(0, 5, ['d', 'g']), (3, 3, ['a', 'b']), (4, 2, ['j', 'k'])]
+
+
+@core
+def test_analysis_session():
+    for graph in (graph1, graph2):
+        session = AnalysisSession(graph)
+        assert session.sccs == find_sccs(graph)
+        assert session.prepost == prepost(graph)
+        assert session.edge_class_codes == edge_class_codes(graph)
+        assert session.classify_edges() == classify_edges(graph)
+        assert session.condensation.num_edges == condensation(graph).num_edges
+
+    # Each artifact is built once and shared by later queries
+    session = AnalysisSession(graph1)
+    assert session.prepost is session.prepost
+    assert session.summary is session.summary
+    assert session.forward_forest is session.forward_forest
+
+
+@core
+def test_record_phases():
+    edges = sum(len(neighbors) for neighbors in graph1.values())
+    with record_phases(memory=True) as recorder:
+        assert find_sccs(graph1) == find_sccs(graph1, 'tarjan')
+        prepost(graph1)
+
+    totals = recorder.totals()
+    assert list(totals) == ['reverse', 'dfs_reverse', 'order', 'dfs_original', 'search', 'dfs']
+    assert totals['reverse'].edges == 2 * edges
+    assert totals['search'].nodes == len(graph1) and totals['search'].edges == edges
+    assert totals['dfs_original'].nodes == len(graph1) and totals['dfs_original'].edges == edges
+    assert totals['dfs'].nodes == len(graph1) and totals['dfs'].edges == edges
+    assert all(phase.seconds >= 0 and phase.peak_bytes >= 0 for phase in totals.values())
+
+    # The CSR paths record the same phases after to_csr
+    with record_phases() as recorder:
+        find_sccs(CSRGraph.from_graph(graph1))
+    assert [phase.name for phase in recorder.phases] == ['to_csr', 'reverse', 'dfs_reverse', 'order', 'dfs_original']
+    with record_phases() as summarized:
+        scc_summary(graph1)
+    assert [phase.name for phase in summarized.phases] == [phase.name for phase in recorder.phases]
+
+    # Nothing is recorded outside the block
+    find_sccs(graph1)
+    assert len(recorder.phases) == 5
+
+
+@core
+def test_condensation():
+    dag = condensation(graph1)
+
+    # components are [{d,g,h,i,l}, {e}, {c}, {a,b,f}, {j,k}]
+    assert list(dag.sizes) == [5, 1, 1, 3, 2]
+    assert [list(dag.successors(c)) for c in range(len(dag))] == [[], [0], [0, 1], [1, 2], [0, 3]]
+    assert dag.num_edges == 7
+
+
+@core
+def test_incremental_scc():
+    sccs = IncrementalSCC(graph2, find_sccs(graph2))
+    assert sccs.sccs() == find_sccs(graph2)
+
+    # n02 -> n01 closes a cycle through n01's component
+    assert sccs.add_edge('n02', 'n01')
+    assert sccs.same_component('n01', 'n05')
+    assert not sccs.add_edge('n11', 'n09')
+
+    components = sccs.sccs()
+    assert components[0] == {'n01', 'n02', 'n03', 'n04', 'n05', 'n06', 'n07', 'n08'}
+    assert components[-1] == {'n11'}
+    assert sorted(map(sorted, components[1:3])) == [['n09'], ['n10']]
+
+
+@core
+def test_csr_graph():
+    csr = CSRGraph.from_graph({'a': ['b', 'x'], 'b': ['a']})
+
+    assert csr.labels == ['a', 'b', 'x']
+    assert list(csr.offsets) == [0, 2, 3, 3]
+    assert list(csr.targets) == [1, 2, 0]
+    assert csr.to_graph() == {'a': ['b', 'x'], 'b': ['a'], 'x': []}
+    assert csr.reverse().to_graph() == {'a': ['b'], 'b': ['a'], 'x': ['a']}
+
+
+@core
+def test_csr_matches_dict_results():
+    csr = CSRGraph.from_graph(graph1)
+
+    assert prepost(csr) == prepost(graph1)
+    assert find_sccs(csr) == find_sccs(graph1)
+    assert classify_edges(csr, prepost(csr)) == classify_edges(graph1, prepost(graph1))
+
+
+@core
+def test_graph_file(tmp_path):
+    path = str(tmp_path / 'graph1.csr')
+    write_graph_file(path, graph1)
+    mapped = open_graph_file(path)
+
+    assert list(mapped.labels) == list(graph1)
+    assert prepost(mapped) == prepost(graph1)
+    assert find_sccs(mapped) == find_sccs(graph1)
+
+
+@core
+def test_wiki_votes(tmp_path):
+    path = tmp_path / 'wikiRfA.csv'
+    path.write_text(
+        'SOURCE,TARGET,VOTE\n'
+        'c,a,1\nb,a,-1\nc,a,-1\na,b,1\nc,a,1\nb,d,0\na,c,-1\nb,a,1\n'
+    )
+    votes = load_wiki_votes(str(path))
+
+    # One entry per distinct (source, target, vote); mixed-sign votes on a pair are one edge
+    assert list(votes.votes) == [1, -1, -1, 1, 0, -1, 1]
+    assert list(votes.edge_mask(1)) == [1, 0, 0, 1, 0, 0, 1]
+    assert list(votes.edge_mask(predicate=lambda vote: vote <= 0)) == [0, 1, 1, 0, 1, 1, 0]
+
+    # Keys and adjacency lists in the order the rows first name them
+    expected = {
+        None: {'c': ['a'], 'a': ['b', 'c'], 'b': ['a', 'd'], 'd': []},
+        1: {'c': ['a'], 'a': ['b'], 'b': ['a']},
+        -1: {'b': ['a'], 'a': ['c'], 'c': ['a']},
+    }
+    for vote_filter, graph in expected.items():
+        loaded = load_wiki_graph(str(path), vote_filter)
+        assert list(loaded.items()) == list(graph.items())
+        assert load_wiki_graph(str(path), vote_filter, csr=True).to_graph() == loaded
+
+    nonzero = votes.graph(votes.edge_mask(predicate=bool))
+    assert list(nonzero.items()) == [('c', ['a']), ('a', ['b', 'c']), ('b', ['a'])]
+
+
+@core
+def test_generate_graph_vectorized():
+    for seed in range(5):
+        graph = generate_graph_vectorized(6, 3.0, seed=seed)
+        assert generate_graph_vectorized(6, 3.0, seed=seed, csr=True).to_graph() == graph
+
+    # At this density many steps are longer than the graph, so they wrap or clip
+    for seed in range(50):
+        graph = generate_graph_vectorized(10, 6.0, seed=seed)
+        assert 'n01' not in graph['n01'] and 'n10' not in graph['n10']
+
+
+@core
+def test_write_graph_chunks(tmp_path):
+    import numpy as np
+
+    first, second = tmp_path / 'first.edges', tmp_path / 'second.edges'
+    edges = write_graph_chunks(str(first), 50, 1.5, seed=7, chunk_size=16)
+    write_graph_chunks(str(second), 50, 1.5, seed=7, chunk_size=16)
+    assert first.read_bytes() == second.read_bytes()
+
+    pairs = np.fromfile(first, dtype='<i4', offset=16).reshape(-1, 2)
+    assert len(pairs) == edges
+    assert (np.diff(pairs[:, 0]) >= 0).all()
+
+    csr = load_edge_file(str(first), chunk_edges=edges // 3)
+    assert len(csr) == 50 and csr.num_edges == edges
+    assert list(csr.targets) == pairs[:, 1].tolist()
+
+
+@core
+def test_result_cache(tmp_path, monkeypatch):
+    assert graph_fingerprint(graph1) == graph_fingerprint(CSRGraph.from_graph(graph1))
+    assert graph_fingerprint(graph1) != graph_fingerprint(graph2)
+
+    cache = ResultCache(str(tmp_path))
+    assert cache.find_sccs(graph1) == find_sccs(graph1)
+    assert cache.prepost(graph1) == prepost(graph1)
+    assert cache.edge_class_codes(graph1) == edge_class_codes(graph1)
+    assert len(list(tmp_path.glob('*.pickle'))) == 3
+
+    # A second cache over the same directory reads the stored results
+    reopened = ResultCache(str(tmp_path), max_bytes=0)
+    assert reopened.find_sccs(graph1) == find_sccs(graph1)
+    assert reopened.prepost(graph2) == prepost(graph2)
+    assert list(tmp_path.glob('*.pickle')) == []
+
+    # Entries another process evicts between the listing and their stat are skipped
+    cache.find_sccs(graph1)
+    listed = list(os.scandir(tmp_path))
+    for path in tmp_path.glob('*.pickle'):
+        path.unlink()
+    monkeypatch.setattr(os, 'scandir', lambda directory: iter(listed))
+    reopened._evict()
+
+
+@core
+def test_results_store(tmp_path):
+    path = str(tmp_path / 'results.csv')
+    first = [(0.5, 10, 10, 12, 1e-05), (1, 10, 10, 15, 2e-05)]
+    second = [(0.5, 10, 10, 12, 3e-05)]
+    append_results(first, RunInfo('2024-01-01T00:00:00+00:00', 'find_sccs', 'abc123', 'test'), path)
+    append_results(second, RunInfo('2024-01-02T00:00:00+00:00', 'prepost', 'def456', 'test'), path)
+
+    results = load_results(path)
+    assert len(results) == 3
+    assert results.runs() == ['2024-01-01T00:00:00+00:00', '2024-01-02T00:00:00+00:00']
+    assert results.latest().runtimes() == second
+    assert results.where(algorithm='find_sccs').runtimes() == first
+    assert results.where(revision='abc123', density=1.0)['E'] == [15]
+
+    # Each run keeps the settings it was measured with, and check_regression
+    # refuses to compare a sweep made with other ones
+    vectorized = RunInfo('2024-01-03T00:00:00+00:00', 'find_sccs', 'abc123', 'test',
+                         'generate_graph_vectorized', 5, 1)
+    append_results(first, vectorized, path)
+    assert load_results(path).latest().run_info() == vectorized
+    with pytest.raises(SystemExit, match='not comparable'):
+        check_regression(path=path, repeats=3)
+    with pytest.raises(SystemExit, match='not comparable'):
+        check_regression(path=path, vectorized=False)
+
+
+@core
+def test_fit_models():
+    import numpy as np
+    from complexity_models import fit_models
+
+    rng = np.random.default_rng(5)
+    sizes = [(v, int(v * d)) for v in (10, 100, 1000, 10000) for d in (0.5, 1, 2, 4)] * 3
+    noise = rng.normal(1, 0.01, len(sizes))
+    linear = [(0, 0, v, e, (2e-6 + 3e-8 * (v + e)) * k) for (v, e), k in zip(sizes, noise)]
+    log_linear = [(0, 0, v, e, (2e-6 + 3e-8 * (v + e) * np.log2(v)) * k) for (v, e), k in zip(sizes, noise)]
+
+    best = fit_models(linear, ['V+E', '(V+E) log V'])[0]
+    assert best.name == 'V+E'
+    assert abs(best.coefficients[0] / 3e-8 - 1) < 0.02
+    assert best.rms_residual < 0.02
+    assert abs(best.predict(1000, 2000) / (2e-6 + 3e-8 * 3000) - 1) < 0.02
+
+    assert fit_models(log_linear, ['V+E', '(V+E) log V'])[0].name == '(V+E) log V'
+
+
+@core
+def test_regression_check():
+    assert mann_whitney_p([1, 2, 3, 4, 5, 6, 7, 8], [11, 12, 13, 14, 15, 16, 17, 18]) < 0.001
+    assert mann_whitney_p([11, 12, 13, 14, 15, 16, 17, 18], [1, 2, 3, 4, 5, 6, 7, 8]) > 0.999
+    assert mann_whitney_p([5] * 8, [5] * 8) == 1.0
+
+    baseline = [(1, 100, 100, 100, 2e-4 * (1 + i / 100)) for i in range(10)]
+    same = [(1, 100, 100, 100, 2e-4 * (1 + i / 95)) for i in range(10)]
+    slower = [(1, 100, 100, 100, 3e-4 * (1 + i / 100)) for i in range(10)]
+
+    assert not compare_runtimes(baseline, same)[0].regressed
+    [cell] = compare_runtimes(baseline, slower, threshold=0.2)
+    assert cell.regressed and abs(cell.ratio - 1.5) < 1e-9
+    assert not compare_runtimes(baseline, slower, threshold=0.6)[0].regressed
+
+
+@core
+def test_benchmark_helpers():
+    assert summarize([5, 1, 3, 2, 4]) == (1, 3, 2)
+    assert summarize([7]) == (7, 7, 0)
+
+    calls = []
+    for enabled in (True, False):
+        if enabled:
+            gc.enable()
+        else:
+            gc.disable()
+        try:
+            samples = measure(calls.append, 'graph', repeats=3, warmup=2)
+            assert gc.isenabled() == enabled
+        finally:
+            gc.enable()
+        assert len(samples) == 3 and all(sample >= 0 for sample in samples)
+    assert calls == ['graph'] * 10
+
+    with pytest.raises(ValueError):
+        measure(calls.append, 'graph', repeats=0)
+
+
+@core
+def test_sample_subgraph():
+    assert list(sample_subgraph(graph2, 4)) == ['n01', 'n02', 'n03', 'n05']
+    assert sample_subgraph(graph2, 4, induced=True)['n05'] == []
+
+    for strategy in ('random_walk', 'forest_fire'):
+        sample = sample_subgraph(graph2, 6, strategy, induced=True, seed=1)
+        assert len(sample) == 6
+        assert all(v in sample for neighbors in sample.values() for v in neighbors)
+
+    # Repeated neighbors are burned once
+    multi = as_csr({'a': ['b', 'b', 'c', 'c'], 'b': [], 'c': []})
+    assert sorted(forest_fire_sample(multi, 3, seed=3)) == [0, 1, 2]
+
+
 @stretch1
 def test_edge_types():
     trees = prepost(graph1)
@@ -158,3 +494,23 @@ def test_edge_types2():
     }
 
     assert edge_types == expected_edge_types
+
+
+@stretch1
+def test_edge_types_during_dfs():
+    for graph in (graph1, graph2, {'a': ['a', 'b'], 'b': ['a']}):
+        trees = prepost(graph)
+        assert edge_class_codes(graph) == edge_class_codes(graph, trees)
+        assert classify_edges(graph) == classify_edges(graph, trees)
+
+    assert classify_edges(graph1, counts_only=True) == {'tree/forward': 11, 'back': 3, 'cross': 5}
+
+    # Counts are the sizes of the sets, so repeated neighbors count once
+    for graph in ({'a': ['b', 'b'], 'b': []}, {'a': ['b', 'c', 'b', 'a', 'a'], 'b': ['a', 'a'], 'c': ['b']}):
+        counts = {name: len(edges) for name, edges in classify_edges(graph).items()}
+        assert classify_edges(graph, counts_only=True) == counts
+        assert classify_edges(CSRGraph.from_graph(graph), counts_only=True) == counts
+        assert AnalysisSession(graph).classify_edges(counts_only=True) == counts
+        assert CSRGraph.from_graph(graph).reverse().has_repeated_edges
+    assert not CSRGraph.from_graph(graph1).has_repeated_edges
+    assert classify_edges({'a': ['b', 'b'], 'b': []}, counts_only=True)['tree/forward'] == 1